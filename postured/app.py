@@ -1,7 +1,9 @@
 import subprocess
 import sys
+from bisect import bisect_right
+from operator import itemgetter
 
-from PyQt6.QtCore import QObject, pyqtSlot
+from PyQt6.QtCore import QObject, QRect, pyqtSlot
 from PyQt6.QtGui import QScreen
 from PyQt6.QtWidgets import QApplication
 
@@ -21,9 +23,16 @@ class MonitorDetector:
     HYSTERESIS_FRAMES = 5  # Frames before switching monitors
 
     def __init__(self):
-        self._current_monitor_id: str | None = None
-        self._pending_monitor_id: str | None = None
+        # Hysteresis tracks small int handles; IDs are only mapped at the edges
+        self._handles: dict[str, int] = {}
+        self._monitor_ids: list[str] = []
+        self._current_monitor: int | None = None
+        self._pending_monitor: int | None = None
         self._pending_frames: int = 0
+        # Screen layout, rebuilt only when screens change
+        self._boundaries: list[int] = []
+        self._layout_handles: list[int] | None = None
+        self._total_width = 0
 
     def update(self, nose_x: float, screens: list[QScreen]) -> str | None:
         """Update monitor detection with new nose X position.
@@ -38,64 +47,88 @@ class MonitorDetector:
         if not screens:
             return None
 
-        detected = self._detect_monitor(nose_x, screens)
-
-        # Apply hysteresis
-        if detected != self._current_monitor_id:
-            if detected == self._pending_monitor_id:
-                self._pending_frames += 1
-                if self._pending_frames >= self.HYSTERESIS_FRAMES:
-                    self._current_monitor_id = detected
-                    self._pending_monitor_id = None
-                    self._pending_frames = 0
-            else:
-                self._pending_monitor_id = detected
-                self._pending_frames = 1
-        else:
-            self._pending_monitor_id = None
+        if self._layout_handles is None or len(self._layout_handles) != len(screens):
+            self._build_layout(screens)
+        detected = self._detect_monitor(nose_x)
+
+        # Apply hysteresis; staying on the current monitor is the common case
+        if detected == self._current_monitor:
+            self._pending_monitor = None
             self._pending_frames = 0
+        elif detected == self._pending_monitor:
+            self._pending_frames += 1
+            if self._pending_frames >= self.HYSTERESIS_FRAMES:
+                self._current_monitor = detected
+                self._pending_monitor = None
+                self._pending_frames = 0
+        else:
+            self._pending_monitor = detected
+            self._pending_frames = 1
+
+        return self.current_monitor_id
+
+    def _handle_for(self, monitor_id: str) -> int:
+        """Return the handle for a monitor ID, assigning one on first sight."""
+        handle = self._handles.get(monitor_id)
+        if handle is None:
+            handle = len(self._monitor_ids)
+            self._handles[monitor_id] = handle
+            self._monitor_ids.append(monitor_id)
+        return handle
+
+    def _build_layout(self, screens: list[QScreen]) -> None:
+        """Cache screen right edges and handles, sorted left to right."""
+        # Read each screen's geometry once, sorted by X position
+        layout = []
+        for screen in screens:
+            geometry = screen.geometry()
+            layout.append((geometry.x(), geometry.width(), screen))
+        layout.sort(key=itemgetter(0))
 
-        return self._current_monitor_id
+        boundaries = []
+        cumulative_x = 0
+        for _, width, _ in layout:
+            cumulative_x += width
+            boundaries.append(cumulative_x)
 
-    def _detect_monitor(self, nose_x: float, screens: list[QScreen]) -> str:
-        """Map nose X position to monitor ID.
+        self._boundaries = boundaries
+        self._layout_handles = [
+            self._handle_for(get_monitor_id(screen)) for _, _, screen in layout
+        ]
+        self._total_width = cumulative_x
 
-        Camera is mirrored: left in camera = right on screen.
-        """
-        # Mirror the X coordinate
-        mirrored_x = 1.0 - nose_x
-
-        # Sort screens by X position (left to right)
-        sorted_screens = sorted(screens, key=lambda s: s.geometry().x())
+    def invalidate_layout(self) -> None:
+        """Drop the cached screen layout so the next update rebuilds it."""
+        self._layout_handles = None
 
-        # Calculate total desktop width
-        total_width = sum(s.geometry().width() for s in sorted_screens)
-        if total_width == 0:
-            return get_monitor_id(sorted_screens[0])
+    def _detect_monitor(self, nose_x: float) -> int:
+        """Map nose X position to a monitor handle using the cached layout.
 
-        # Map mirrored_x to desktop coordinate
-        desktop_x = mirrored_x * total_width
+        Camera is mirrored: left in camera = right on screen.
+        """
+        handles = self._layout_handles
+        # Most setups have one screen, which wins regardless of position
+        if len(handles) == 1 or self._total_width == 0:
+            return handles[0]
 
-        # Find containing screen
-        cumulative_x = 0
-        for screen in sorted_screens:
-            screen_width = screen.geometry().width()
-            if desktop_x < cumulative_x + screen_width:
-                return get_monitor_id(screen)
-            cumulative_x += screen_width
+        # Mirror the X coordinate and map it to desktop coordinate
+        desktop_x = (1.0 - nose_x) * self._total_width
 
-        # Fallback to last screen
-        return get_monitor_id(sorted_screens[-1])
+        # First screen whose right edge lies past desktop_x, else the last one
+        index = bisect_right(self._boundaries, desktop_x)
+        return handles[min(index, len(handles) - 1)]
 
     @property
     def current_monitor_id(self) -> str | None:
         """Currently detected monitor ID."""
-        return self._current_monitor_id
+        if self._current_monitor is None:
+            return None
+        return self._monitor_ids[self._current_monitor]
 
     def reset(self) -> None:
         """Reset detection state."""
-        self._current_monitor_id = None
-        self._pending_monitor_id = None
+        self._current_monitor = None
+        self._pending_monitor = None
         self._pending_frames = 0
 
 
@@ -143,6 +176,10 @@ class Application(QObject):
         self.consecutive_good_frames = 0
         self.consecutive_no_detection = 0
         self._screen_locked_this_away = False
+        # (posture_range, enter, exit, opacity_gain) for the
+        # (good_y, bad_y, sensitivity) key
+        self._threshold_key: tuple[float, float, float] | None = None
+        self._thresholds = (0.0, 0.0, 0.0, 0.0)
 
         self._dbus_adaptor = register_dbus_service(self)
 
@@ -186,6 +223,8 @@ class Application(QObject):
         app = QApplication.instance()
         app.screenAdded.connect(self._on_screen_added)
         app.screenRemoved.connect(self._on_screen_removed)
+        for screen in app.screens():
+            screen.geometryChanged.connect(self._on_screen_geometry_changed)
 
         # Screen lock auto-pause
         self._screen_lock_monitor.screen_locked.connect(self._on_screen_lock_changed)
@@ -199,6 +238,7 @@ class Application(QObject):
         if screens:
             primary_id = get_monitor_id(screens[0])
             if self.settings.migrate_legacy_calibration(primary_id):
+                self.settings.sync()
                 self._load_monitor_calibrations()
                 if self.debug:
                     self._print_debug(f"Migrated legacy calibration to {primary_id}")
@@ -298,6 +338,7 @@ class Application(QObject):
     def _on_calibration_cancelled(self):
         # Mark as calibrated so we don't prompt again (user can use defaults)
         self.settings.is_calibrated = True
+        self.settings.sync()
         self._finish_calibration()
         self.tray.set_status("Using defaults")
 
@@ -373,19 +414,36 @@ class Application(QObject):
             bad_y = self.settings.DEFAULTS["bad_posture_y"]
             uncalibrated_suffix = " (uncalibrated)"
 
-        posture_range = abs(bad_y - good_y)
-        if posture_range < 0.01:
-            posture_range = 0.2
+        # Read each setting once per frame
+        sensitivity = self.settings.sensitivity
+        notification_mode = self.settings.notification_mode
+
+        # Thresholds only change with calibration or sensitivity
+        threshold_key = (good_y, bad_y, sensitivity)
+        if threshold_key != self._threshold_key:
+            posture_range = abs(bad_y - good_y)
+            if posture_range < 0.01:
+                posture_range = 0.2
+
+            base_threshold = self.DEAD_ZONE * posture_range * sensitivity
+
+            # Hysteresis
+            enter_threshold = base_threshold
+            exit_threshold = base_threshold * self.HYSTERESIS_FACTOR
+            opacity_gain = 0.97 * sensitivity
+
+            self._threshold_key = threshold_key
+            self._thresholds = (
+                posture_range,
+                enter_threshold,
+                exit_threshold,
+                opacity_gain,
+            )
+        posture_range, enter_threshold, exit_threshold, opacity_gain = self._thresholds
 
         # Slouching = nose Y is ABOVE bad_posture_y (lower in frame = higher Y value)
         slouch_amount = current_y - bad_y
 
-        base_threshold = self.DEAD_ZONE * posture_range * self.settings.sensitivity
-
-        # Hysteresis
-        enter_threshold = base_threshold
-        exit_threshold = base_threshold * self.HYSTERESIS_FACTOR
-
         threshold = exit_threshold if self.is_slouching else enter_threshold
         is_bad_posture = slouch_amount > threshold
 
@@ -397,13 +455,13 @@ class Application(QObject):
                 was_slouching = self.is_slouching
                 self.is_slouching = True
 
-                if self.settings.notification_mode == "dim_screen":
+                if notification_mode == "dim_screen":
                     # Calculate blur intensity
                     severity = (slouch_amount - enter_threshold) / posture_range
                     severity = max(0.0, min(1.0, severity))
                     eased_severity = severity * severity  # Quadratic ease-in
 
-                    opacity = 0.03 + eased_severity * 0.97 * self.settings.sensitivity
+                    opacity = 0.03 + eased_severity * opacity_gain
                     self.overlay.set_target_opacity(opacity)
 
                 self.tray.set_status(f"Slouching{uncalibrated_suffix}")
@@ -411,13 +469,13 @@ class Application(QObject):
 
                 if not was_slouching:
                     self._emit_dbus_status()
-                    if self.settings.notification_mode == "led_blink":
+                    if notification_mode == "led_blink":
                         self.led_blinker.on_slouching_started()
         else:
             self.consecutive_good_frames += 1
             self.consecutive_bad_frames = 0
 
-            if self.settings.notification_mode == "dim_screen":
+            if notification_mode == "dim_screen":
                 self.overlay.set_target_opacity(0)
 
             if self.consecutive_good_frames >= self.FRAME_THRESHOLD:
@@ -428,7 +486,7 @@ class Application(QObject):
 
                 if was_slouching:
                     self._emit_dbus_status()
-                    if self.settings.notification_mode == "led_blink":
+                    if notification_mode == "led_blink":
                         self.led_blinker.on_slouching_stopped()
 
         # Debug: only print state transitions
@@ -528,6 +586,10 @@ class Application(QObject):
         if self.debug:
             self._print_debug(f"Screen added: {monitor_id}")
 
+        # Monitor IDs include the resolution, so track geometry changes too
+        screen.geometryChanged.connect(self._on_screen_geometry_changed)
+        self._invalidate_screens()
+
         # Update overlay to include new screen
         self.overlay.cleanup()
         self.overlay = create_overlay(self)
@@ -542,6 +604,8 @@ class Application(QObject):
         if self.debug:
             self._print_debug(f"Screen removed: {monitor_id}")
 
+        self._invalidate_screens()
+
         # Reset monitor detector if current monitor was removed
         if self.current_monitor_id == monitor_id:
             self.monitor_detector.reset()
@@ -554,8 +618,19 @@ class Application(QObject):
         # Update tray menu
         self._update_tray_calibrations()
 
+    @pyqtSlot(QRect)
+    def _on_screen_geometry_changed(self, geometry: QRect):
+        """Rebuild the monitor layout after a resolution or position change."""
+        self._invalidate_screens()
+
+    def _invalidate_screens(self):
+        """Rebuild the screen layouts in the monitor detector and tray menu."""
+        self.monitor_detector.invalidate_layout()
+        self.tray.invalidate_screens()
+
     def shutdown(self):
         """Clean up resources for graceful shutdown."""
+        self.settings.sync()
         self.pose_detector.close()
         self.overlay.cleanup()
 
@@ -7,6 +7,10 @@ from PyQt6.QtDBus import QDBusAbstractAdaptor, QDBusConnection, QDBusMessage
 
 logger = logging.getLogger(__name__)
 
+# Indexed by the bit length of the state flags, so the highest-priority
+# condition that holds picks the state
+_STATES_BY_PRIORITY = ("good", "slouching", "away", "calibrating", "paused")
+
 
 @pyqtClassInfo("D-Bus Interface", "io.github.vadi2.postured1")
 @pyqtClassInfo(
@@ -30,24 +34,26 @@ class PosturedDBusAdaptor(QDBusAbstractAdaptor):
     def __init__(self, app):
         super().__init__(app)
         self._app = app
+        # Reused for every status reply; PyQt copies it into a QVariantMap
+        # as soon as it is returned or attached to a message
+        self._status = {"state": "good", "enabled": False, "is_slouching": False}
 
     def _get_state_string(self) -> str:
-        if not self._app.is_enabled:
-            return "paused"
-        if self._app.is_calibrating:
-            return "calibrating"
-        if self._app.consecutive_no_detection >= self._app.AWAY_THRESHOLD:
-            return "away"
-        if self._app.is_slouching:
-            return "slouching"
-        return "good"
+        app = self._app
+        flags = (
+            (not app.is_enabled) << 3
+            | app.is_calibrating << 2
+            | (app.consecutive_no_detection >= app.AWAY_THRESHOLD) << 1
+            | app.is_slouching
+        )
+        return _STATES_BY_PRIORITY[flags.bit_length()]
 
     def _build_status_dict(self) -> dict:
-        return {
-            "state": self._get_state_string(),
-            "enabled": self._app.is_enabled,
-            "is_slouching": self._app.is_slouching,
-        }
+        status = self._status
+        status["state"] = self._get_state_string()
+        status["enabled"] = self._app.is_enabled
+        status["is_slouching"] = self._app.is_slouching
+        return status
 
     @pyqtSlot()
     def Pause(self):
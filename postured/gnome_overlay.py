@@ -4,6 +4,7 @@ This module communicates with the postured-overlay GNOME Shell extension
 via D-Bus to control fullscreen dimming overlays on GNOME Wayland.
 """
 
+import math
 import subprocess
 import sys
 
@@ -102,18 +103,16 @@ class GnomeOverlay(QObject):
 
     def _update_opacity(self):
         """Update opacity towards target (called by timer)."""
-        if abs(self.current_opacity - self.target_opacity) < 0.001:
+        delta = self.target_opacity - self.current_opacity
+        if -0.001 < delta < 0.001:
             return
 
         old_opacity = self.current_opacity
-        if self.current_opacity < self.target_opacity:
-            self.current_opacity = min(
-                self.current_opacity + self.EASE_IN_RATE, self.target_opacity
-            )
+        rate = self.EASE_IN_RATE if delta > 0 else self.EASE_OUT_RATE
+        if -rate <= delta <= rate:
+            self.current_opacity = self.target_opacity
         else:
-            self.current_opacity = max(
-                self.current_opacity - self.EASE_OUT_RATE, self.target_opacity
-            )
+            self.current_opacity += math.copysign(rate, delta)
 
         # Log when dimming starts or stops
         if self._debug:
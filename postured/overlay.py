@@ -1,3 +1,5 @@
+import functools
+import math
 import os
 import sys
 
@@ -14,6 +16,7 @@ class OverlayWindow(QWidget):
     def __init__(self, screen):
         super().__init__()
         self.opacity_level = 0.0
+        self._alpha = 0
 
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint
@@ -30,14 +33,18 @@ class OverlayWindow(QWidget):
     def set_opacity(self, level: float):
         """Set overlay darkness (0.0 = invisible, 1.0 = fully dark)."""
         self.opacity_level = max(0.0, min(1.0, level))
+        # Only repaint when the painted alpha actually changes
+        alpha = int(self.opacity_level * 255 * self.MAX_OPACITY)
+        if alpha == self._alpha:
+            return
+        self._alpha = alpha
         self.update()
 
     def paintEvent(self, event):
-        if self.opacity_level <= 0:
+        if self._alpha <= 0:
             return
         painter = QPainter(self)
-        color = QColor(0, 0, 0, int(self.opacity_level * 255 * self.MAX_OPACITY))
-        painter.fillRect(self.rect(), color)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, self._alpha))
 
 
 class QtOverlay(QObject):
@@ -54,9 +61,10 @@ class QtOverlay(QObject):
         self.target_opacity = 0.0
         self._debug = getattr(parent, "debug", False) if parent else False
 
+        # Only runs while a transition is in progress
         self.transition_timer = QTimer(self)
+        self.transition_timer.setInterval(self.TRANSITION_INTERVAL_MS)
         self.transition_timer.timeout.connect(self._update_opacity)
-        self.transition_timer.start(self.TRANSITION_INTERVAL_MS)
 
         self._create_windows()
 
@@ -79,20 +87,23 @@ class QtOverlay(QObject):
                 file=sys.stderr,
                 flush=True,
             )
+        # Called every frame; only wake the timer when there is somewhere to go
+        delta = self.target_opacity - self.current_opacity
+        if not self.transition_timer.isActive() and not -0.001 < delta < 0.001:
+            self.transition_timer.start()
 
     def _update_opacity(self):
-        if abs(self.current_opacity - self.target_opacity) < 0.001:
+        delta = self.target_opacity - self.current_opacity
+        if -0.001 < delta < 0.001:
+            self.transition_timer.stop()
             return
 
         old_opacity = self.current_opacity
-        if self.current_opacity < self.target_opacity:
-            self.current_opacity = min(
-                self.current_opacity + self.EASE_IN_RATE, self.target_opacity
-            )
+        rate = self.EASE_IN_RATE if delta > 0 else self.EASE_OUT_RATE
+        if -rate <= delta <= rate:
+            self.current_opacity = self.target_opacity
         else:
-            self.current_opacity = max(
-                self.current_opacity - self.EASE_OUT_RATE, self.target_opacity
-            )
+            self.current_opacity += math.copysign(rate, delta)
 
         # Log when dimming starts or stops
         if self._debug:
@@ -118,6 +129,7 @@ class QtOverlay(QObject):
             window.close()
 
 
+@functools.cache
 def _is_wayland_session() -> bool:
     """Check if running in a Wayland session."""
     return os.environ.get("XDG_SESSION_TYPE") == "wayland"
@@ -131,6 +143,18 @@ def _check_layer_shell() -> tuple[bool, str]:
     """
     import subprocess
 
+    # A timeout is transient (e.g. a slow startup), so it is not cached
+    try:
+        return _probe_layer_shell()
+    except subprocess.TimeoutExpired:
+        return False, "layer-shell check timed out"
+
+
+@functools.cache
+def _probe_layer_shell() -> tuple[bool, str]:
+    """Run the layer-shell check script once and cache its definitive result."""
+    import subprocess
+
     # Check both library availability AND compositor support
     # Exit codes: 0 = supported, 1 = compositor doesn't support, 2 = library not installed
     check_script = """
@@ -163,8 +187,6 @@ except (ValueError, ImportError):
             )
         else:
             return False, "gir1.2-gtklayershell-0.1 package not installed"
-    except subprocess.TimeoutExpired:
-        return False, "layer-shell check timed out"
     except FileNotFoundError:
         return False, "/usr/bin/python3 not found"
 
@@ -219,6 +241,7 @@ def create_overlay(parent=None):
     return QtOverlay(parent)
 
 
+@functools.cache
 def _is_gnome_session() -> bool:
     """Check if running in a GNOME session."""
     desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
@@ -243,7 +266,7 @@ def needs_gnome_extension() -> bool:
 
 
 def _check_gnome_extension() -> bool:
-    """Check if postured GNOME extension is running."""
+    """Check if postured GNOME extension is running (not cached: it can change)."""
     from .gnome_overlay import check_gnome_extension
 
     return check_gnome_extension()
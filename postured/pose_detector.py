@@ -1,9 +1,10 @@
+import logging
 import threading
 import time
 
 import cv2
 import mediapipe as mp
-from collections import deque
+import numpy as np
 from pathlib import Path
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
 
@@ -11,13 +12,44 @@ from mediapipe.tasks.python import BaseOptions
 from mediapipe.tasks.python.vision import (
     PoseLandmarker,
     PoseLandmarkerOptions,
+    PoseLandmarkerResult,
     PoseLandmark,
     RunningMode,
 )
 
+logger = logging.getLogger(__name__)
+
+_NOSE_IDX = PoseLandmark.NOSE.value
+
+# Frame timestamps are offsets from import time. The landmarker outlives
+# individual workers and needs monotonically increasing timestamps, so the
+# origin is shared rather than per-worker.
+_CLOCK_ORIGIN_S = time.monotonic()
+
+
+class _RollingMean:
+    """Mean over a fixed window, updated in O(1) with a running sum."""
+
+    def __init__(self, size: int):
+        self.values = [0.0] * size
+        self.size = size
+        self.total = 0.0
+        self.index = 0
+        self.count = 0
+
+    def add(self, value: float) -> float:
+        """Add a sample, evicting the oldest once full, and return the mean."""
+        index = self.index
+        self.total += value - self.values[index]
+        self.values[index] = value
+        self.index = (index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        return self.total / self.count
+
 
 class PoseWorker(QObject):
-    """Worker that runs pose detection in a background thread."""
+    """Worker that captures frames in a background thread for async pose detection."""
 
     pose_detected = pyqtSignal(float, float)  # nose_y, nose_x
     no_detection = pyqtSignal()
@@ -28,8 +60,13 @@ class PoseWorker(QObject):
     FRAME_INTERVAL_S = 0.1  # 10 FPS
     MAX_CONSECUTIVE_FAILURES = 30  # ~3 seconds before reporting camera lost
     RECOVERY_CHECK_INTERVAL_S = 2.0
+    REOPEN_AFTER_CHECKS = 3  # failed recovery checks (~6 seconds) before reopening
     MIN_FRAME_VARIANCE = 20.0  # detect blank frames (e.g. hardware privacy switch)
+    VARIANCE_SAMPLE_STRIDE = 15  # odd, so 2px patterns are sampled on both phases
     MIN_CONFIDENCE = 0.5
+    CAPTURE_WIDTH = 640
+    CAPTURE_HEIGHT = 480
+    PROCESS_WIDTH = 320  # frames are downscaled to this width before inference
 
     def __init__(
         self, landmarker: PoseLandmarker, camera_index: int, debug: bool = False
@@ -39,24 +76,30 @@ class PoseWorker(QObject):
         self.camera_index = camera_index
         self.debug = debug
         self._stop_event = threading.Event()
-        self.nose_y_history: deque[float] = deque(maxlen=self.SMOOTHING_WINDOW)
-        self.nose_x_history: deque[float] = deque(maxlen=self.SMOOTHING_WINDOW)
+        self._first_timestamp_ms: int | None = None
+        self.nose_y_mean = _RollingMean(self.SMOOTHING_WINDOW)
+        self.nose_x_mean = _RollingMean(self.SMOOTHING_WINDOW)
+        self._rgb_buf: np.ndarray | None = None
 
     def run(self):
         """Main loop - runs in background thread."""
-        capture = cv2.VideoCapture(self.camera_index)
+        capture = self._open_capture(warn=True)
         if not capture.isOpened():
             self.error.emit("Failed to open camera")
             return
 
         self._stop_event.clear()
         consecutive_failures = 0
+        failed_checks = 0
         camera_lost = False
 
         while not self._stop_event.is_set():
+            # Pace frames from the start of each iteration so capture and
+            # preprocessing time don't stretch the interval
+            frame_deadline = time.monotonic() + self.FRAME_INTERVAL_S
             ret, frame = capture.read()
-            frame_variance = frame.std() if ret else 0.0
-            if not ret or frame_variance < self.MIN_FRAME_VARIANCE:
+            frame_variance, rgb_frame = self._preprocess(frame) if ret else (0.0, None)
+            if rgb_frame is None:
                 consecutive_failures += 1
                 if consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
                     if not camera_lost:
@@ -71,47 +114,114 @@ class PoseWorker(QObject):
                             msg = "Camera disconnected or unavailable"
                         self.error.emit(msg)
                     self._stop_event.wait(self.RECOVERY_CHECK_INTERVAL_S)
-                    # Reopen camera to detect hardware switch recovery
-                    capture.release()
-                    capture = cv2.VideoCapture(self.camera_index)
+                    # Reopen camera to detect hardware switch recovery, but not
+                    # on every check since renegotiating is slow
+                    failed_checks += 1
+                    if failed_checks >= self.REOPEN_AFTER_CHECKS:
+                        failed_checks = 0
+                        capture.release()
+                        capture = self._open_capture()
                 else:
-                    self._stop_event.wait(self.FRAME_INTERVAL_S)
+                    self._wait_until(frame_deadline)
                 continue
 
             if camera_lost:
                 camera_lost = False
                 self.recovered.emit()
             consecutive_failures = 0
+            failed_checks = 0
 
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # mp.Image copies the pixels on construction, so it cannot be kept
+            # around and refreshed through the reused RGB buffer
             mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
 
-            frame_timestamp = int(time.monotonic() * 1000)
-            results = self.landmarker.detect_for_video(mp_image, frame_timestamp)
-
-            if results.pose_landmarks:
-                landmarks = results.pose_landmarks[0]
-                nose = landmarks[PoseLandmark.NOSE]
-                smoothed_y = self._smooth_y(nose.y)
-                smoothed_x = self._smooth_x(nose.x)
-                self.pose_detected.emit(smoothed_y, smoothed_x)
-            else:
-                self.no_detection.emit()
+            frame_timestamp = int((time.monotonic() - _CLOCK_ORIGIN_S) * 1000)
+            if self._first_timestamp_ms is None:
+                self._first_timestamp_ms = frame_timestamp
+            self.landmarker.detect_async(mp_image, frame_timestamp)
 
-            self._stop_event.wait(self.FRAME_INTERVAL_S)
+            self._wait_until(frame_deadline)
 
         capture.release()
 
     def stop(self):
         self._stop_event.set()
 
+    def _wait_until(self, deadline: float):
+        """Sleep until a monotonic deadline, returning early on stop."""
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            self._stop_event.wait(remaining)
+
+    def handle_result(self, results: PoseLandmarkerResult, timestamp_ms: int):
+        """Process a landmarker result (called on MediaPipe's callback thread)."""
+        # Ignore results still in flight from before this worker started
+        if self._stop_event.is_set() or self._first_timestamp_ms is None:
+            return
+        if timestamp_ms < self._first_timestamp_ms:
+            return
+
+        poses = results.pose_landmarks
+        if poses:
+            nose = poses[0][_NOSE_IDX]
+            self.pose_detected.emit(self._smooth_y(nose.y), self._smooth_x(nose.x))
+        else:
+            self.no_detection.emit()
+
+    def _open_capture(self, warn: bool = False) -> cv2.VideoCapture:
+        """Open the camera with a single-frame driver queue so reads are never stale."""
+        capture = cv2.VideoCapture(self.camera_index, cv2.CAP_V4L2)
+        if not capture.isOpened():
+            capture = cv2.VideoCapture(self.camera_index)
+            if not capture.isOpened():
+                return capture
+
+        properties = [
+            (cv2.CAP_PROP_BUFFERSIZE, 1, "buffer size"),
+            (cv2.CAP_PROP_FRAME_WIDTH, self.CAPTURE_WIDTH, "frame width"),
+            (cv2.CAP_PROP_FRAME_HEIGHT, self.CAPTURE_HEIGHT, "frame height"),
+        ]
+        for prop, value, name in properties:
+            if not capture.set(prop, value) and warn:
+                logger.warning(f"Camera driver refused to set {name} to {value}")
+        return capture
+
+    def _preprocess(self, frame: np.ndarray) -> tuple[float, np.ndarray | None]:
+        """Return the frame's pixel spread and its RGB copy, or None if blank."""
+        # Sample the full-resolution frame: downscaling averages pixels and
+        # would lower the spread that MIN_FRAME_VARIANCE was chosen against
+        frame_variance = self._frame_variance(frame)
+        if frame_variance < self.MIN_FRAME_VARIANCE:
+            return frame_variance, None
+        return frame_variance, self._to_rgb(self._downscale(frame))
+
+    def _frame_variance(self, frame: np.ndarray) -> float:
+        """Estimate pixel spread from a strided subsample of the frame."""
+        step = self.VARIANCE_SAMPLE_STRIDE
+        sample = np.ascontiguousarray(frame[::step, ::step])
+        # View as one channel so the result covers all colour channels at once
+        _, std = cv2.meanStdDev(sample.reshape(sample.shape[0], -1))
+        return float(std[0, 0])
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink the frame towards the model's input size, keeping aspect ratio."""
+        height, width = frame.shape[:2]
+        if width <= self.PROCESS_WIDTH:
+            return frame
+        size = (self.PROCESS_WIDTH, round(height * self.PROCESS_WIDTH / width))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    def _to_rgb(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a BGR camera frame to RGB in a buffer reused across frames."""
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+
     def _smooth_y(self, raw_y: float) -> float:
-        self.nose_y_history.append(raw_y)
-        return sum(self.nose_y_history) / len(self.nose_y_history)
+        return self.nose_y_mean.add(raw_y)
 
     def _smooth_x(self, raw_x: float) -> float:
-        self.nose_x_history.append(raw_x)
-        return sum(self.nose_x_history) / len(self.nose_x_history)
+        return self.nose_x_mean.add(raw_x)
 
 
 class PoseDetector(QObject):
@@ -141,15 +251,24 @@ class PoseDetector(QObject):
                 raise FileNotFoundError(f"Model file not found: {self._model_path}")
             options = PoseLandmarkerOptions(
                 base_options=BaseOptions(model_asset_path=str(self._model_path)),
-                running_mode=RunningMode.VIDEO,
+                running_mode=RunningMode.LIVE_STREAM,
                 num_poses=1,
                 min_pose_detection_confidence=PoseWorker.MIN_CONFIDENCE,
                 min_pose_presence_confidence=PoseWorker.MIN_CONFIDENCE,
                 min_tracking_confidence=PoseWorker.MIN_CONFIDENCE,
+                result_callback=self._on_result,
             )
             self._landmarker = PoseLandmarker.create_from_options(options)
         return self._landmarker
 
+    def _on_result(
+        self, results: PoseLandmarkerResult, image: mp.Image, timestamp_ms: int
+    ):
+        """Forward a LIVE_STREAM result to the active worker."""
+        worker = self.worker
+        if worker is not None:
+            worker.handle_result(results, timestamp_ms)
+
     def start(self, camera_index: int = 0):
         if self.thread is not None:
             self.stop()
@@ -196,19 +315,84 @@ class PoseDetector(QObject):
     def available_cameras() -> list[tuple[int, str]]:
         """Return list of (index, name) for available cameras."""
         import subprocess
+
+        try:
+            result = subprocess.run(
+                ["v4l2-ctl", "--list-devices"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            # v4l2-ctl not available, fall back to OpenCV detection
+            return PoseDetector._probe_cameras()
+
+        cameras = []
+        for name, indexes in PoseDetector._parse_v4l2_devices(result.stdout):
+            # Keep the first node of each device that can capture video
+            for i in indexes:
+                try:
+                    info = subprocess.run(
+                        ["v4l2-ctl", "-d", f"/dev/video{i}", "--info"],
+                        capture_output=True,
+                        text=True,
+                        timeout=2,
+                    )
+                except subprocess.TimeoutExpired:
+                    continue
+                if info.returncode == 0 and PoseDetector._has_video_capture(
+                    info.stdout
+                ):
+                    cameras.append((i, name))
+                    break
+        return cameras
+
+    @staticmethod
+    def _parse_v4l2_devices(output: str) -> list[tuple[str, list[int]]]:
+        """Parse `v4l2-ctl --list-devices` output into (name, video indexes)."""
         import re
+
+        devices = []
+        indexes = None
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            if not line[0].isspace():
+                # Header: "<card name> (<bus info>):"
+                name = line.rsplit(" (", 1)[0].strip().rstrip(":")
+                indexes = []
+                devices.append((name, indexes))
+                continue
+            match = re.fullmatch(r"\s*/dev/video(\d+)", line)
+            if match and indexes is not None:
+                indexes.append(int(match.group(1)))
+        return [(name, indexes) for name, indexes in devices if indexes]
+
+    @staticmethod
+    def _has_video_capture(info: str) -> bool:
+        """Check `v4l2-ctl --info` output for the Video Capture device cap."""
+        import re
+
+        # Device Caps lists one capability per doubly indented line
+        match = re.search(r"Device Caps\s*:.*?\n((?:\t\t.*\n)*)", info)
+        return match is not None and "Video Capture" in match.group(1)
+
+    @staticmethod
+    def _probe_cameras() -> list[tuple[int, str]]:
+        """Find cameras by opening each existing /dev/video* node with OpenCV."""
+        import glob
         import os
 
         cameras = []
         seen_devices = set()
 
-        for i in range(10):
-            device = f"/dev/video{i}"
-
-            # Skip if device doesn't exist
-            if not os.path.exists(device):
-                continue
+        indexes = []
+        for path in glob.glob("/dev/video*"):
+            suffix = path.removeprefix("/dev/video")
+            if suffix.isdigit():
+                indexes.append(int(suffix))
 
+        for i in sorted(indexes):
             sysfs_device = f"/sys/class/video4linux/video{i}/device"
             if os.path.islink(sysfs_device):
                 physical_device = os.path.realpath(sysfs_device)
@@ -216,48 +400,17 @@ class PoseDetector(QObject):
                     continue
                 seen_devices.add(physical_device)
 
-            try:
-                result = subprocess.run(
-                    ["v4l2-ctl", "-d", device, "--all"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode != 0:
-                    continue
-
-                output = result.stdout
-                # Check if device has video capture capability (not just metadata)
-                device_caps_match = re.search(
-                    r"Device Caps\s*:.*?\n((?:\t\t.*\n)*)", output
-                )
-                if not device_caps_match:
-                    continue
-                device_caps = device_caps_match.group(1)
-                if "Video Capture" not in device_caps:
-                    continue
-
-                name_match = re.search(r"Card type\s*:\s*(.+)", output)
-                name = (
-                    name_match.group(1).strip().rstrip(":")
-                    if name_match
-                    else f"Camera {i}"
-                )
-
+            cap = cv2.VideoCapture(i)
+            if cap.isOpened():
+                name = f"Camera {i}"
+                name_path = f"/sys/class/video4linux/video{i}/name"
+                if os.path.exists(name_path):
+                    try:
+                        with open(name_path) as f:
+                            name = f.read().strip().rstrip(":")
+                    except OSError:
+                        pass
                 cameras.append((i, name))
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                # v4l2-ctl not available, fall back to OpenCV detection
-                cap = cv2.VideoCapture(i)
-                if cap.isOpened():
-                    name = f"Camera {i}"
-                    name_path = f"/sys/class/video4linux/video{i}/name"
-                    if os.path.exists(name_path):
-                        try:
-                            with open(name_path) as f:
-                                name = f.read().strip().rstrip(":")
-                        except OSError:
-                            pass
-                    cameras.append((i, name))
-                    cap.release()
+                cap.release()
 
         return cameras
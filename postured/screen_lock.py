@@ -45,8 +45,13 @@ class ScreenLockMonitor(QObject):
             logger.warning("Could not connect to session D-Bus for screen lock")
             return
 
-        # Try screensaver services first
+        # Try screensaver services first, skipping any not on the bus. One
+        # ListNames call is cheaper than introspecting each candidate.
+        reply = bus.interface().registeredServiceNames()
+        running = set(reply.value()) if reply.isValid() else None
         for service, path, interface in self.SCREENSAVER_SERVICES:
+            if running is not None and service not in running:
+                continue
             if self._try_screensaver_connection(bus, service, path, interface):
                 return
 
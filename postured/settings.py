@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from PyQt6.QtGui import QScreen
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitorCalibration:
     """Per-monitor calibration data."""
 
@@ -17,6 +17,22 @@ class MonitorCalibration:
     is_calibrated: bool = True
 
 
+_qsettings: QSettings | None = None
+
+
+def _get_qsettings() -> QSettings:
+    """Return the shared QSettings, opening the config file on first use."""
+    global _qsettings
+    if _qsettings is None:
+        _qsettings = QSettings("postured", "postured")
+    return _qsettings
+
+
+def _clamp(value: float, low: float = 0.0, high: float = 1.0) -> float:
+    """Limit a value to the range [low, high]."""
+    return max(low, min(high, value))
+
+
 def get_monitor_id(screen: "QScreen") -> str:
     """Generate a stable monitor ID from screen properties."""
     return f"{screen.name()}_{screen.geometry().width()}x{screen.geometry().height()}"
@@ -28,6 +44,14 @@ class Settings:
     Stores config in ~/.config/postured/postured.conf (on Linux).
     """
 
+    __slots__ = (
+        "_settings",
+        "_cache",
+        "_dirty",
+        "_monitor_calibrations",
+        "_dirty_monitors",
+    )
+
     DEFAULTS = {
         "sensitivity": 0.85,
         "camera_index": 0,
@@ -39,147 +63,196 @@ class Settings:
     }
 
     def __init__(self):
-        self._settings = QSettings("postured", "postured")
+        self._settings = _get_qsettings()
+        # Validated values, loaded once; setters update them, sync() persists
+        self._cache = {key: self._read(key) for key in self.DEFAULTS}
+        # Changed values waiting for sync() to hand them to QSettings
+        self._dirty: dict[str, object] = {}
+        # Loaded on first use; None marks a monitor without calibration
+        self._monitor_calibrations: dict[str, MonitorCalibration | None] | None = None
+        self._dirty_monitors: dict[str, MonitorCalibration] = {}
+
+    def _read(self, key: str):
+        """Load a setting from QSettings, validating values from disk."""
+        default = self.DEFAULTS[key]
+        if isinstance(default, bool):
+            return self._settings.value(key, default, type=bool)
+        return self._validate(key, self._settings.value(key, default))
+
+    def _validate(self, key: str, value):
+        """Coerce a value to its setting's type and clamp it to the valid range."""
+        default = self.DEFAULTS[key]
+        if isinstance(default, bool):
+            return bool(value)
+        if key == "camera_index":
+            return max(0, int(value))
+        if key == "notification_mode":
+            return value if value in ("dim_screen", "led_blink") else default
+        low = 0.1 if key == "sensitivity" else 0.0
+        return _clamp(float(value), low)
+
+    def _write(self, key: str, value) -> None:
+        # Clamp once here so reads can trust the stored value
+        value = self._validate(key, value)
+        if value == self._cache[key]:
+            return  # QSettings would dirty the file even for the same value
+        self._cache[key] = value
+        self._dirty[key] = value
 
     @property
     def sensitivity(self) -> float:
-        value = float(self._settings.value("sensitivity", self.DEFAULTS["sensitivity"]))
-        return max(0.1, min(1.0, value))
+        return self._cache["sensitivity"]
 
     @sensitivity.setter
     def sensitivity(self, value: float):
-        self._settings.setValue("sensitivity", value)
+        self._write("sensitivity", value)
 
     @property
     def camera_index(self) -> int:
-        value = int(self._settings.value("camera_index", self.DEFAULTS["camera_index"]))
-        return max(0, value)
+        return self._cache["camera_index"]
 
     @camera_index.setter
     def camera_index(self, value: int):
-        self._settings.setValue("camera_index", value)
+        self._write("camera_index", value)
 
     @property
     def lock_when_away(self) -> bool:
-        return self._settings.value(
-            "lock_when_away", self.DEFAULTS["lock_when_away"], type=bool
-        )
+        return self._cache["lock_when_away"]
 
     @lock_when_away.setter
     def lock_when_away(self, value: bool):
-        self._settings.setValue("lock_when_away", value)
+        self._write("lock_when_away", value)
 
     @property
     def notification_mode(self) -> str:
-        value = self._settings.value(
-            "notification_mode", self.DEFAULTS["notification_mode"]
-        )
-        if value not in ("dim_screen", "led_blink"):
-            return self.DEFAULTS["notification_mode"]
-        return value
+        return self._cache["notification_mode"]
 
     @notification_mode.setter
     def notification_mode(self, value: str):
-        self._settings.setValue("notification_mode", value)
+        self._write("notification_mode", value)
 
     @property
     def good_posture_y(self) -> float:
-        value = float(
-            self._settings.value("good_posture_y", self.DEFAULTS["good_posture_y"])
-        )
-        return max(0.0, min(1.0, value))
+        return self._cache["good_posture_y"]
 
     @good_posture_y.setter
     def good_posture_y(self, value: float):
-        self._settings.setValue("good_posture_y", value)
+        self._write("good_posture_y", value)
 
     @property
     def bad_posture_y(self) -> float:
-        value = float(
-            self._settings.value("bad_posture_y", self.DEFAULTS["bad_posture_y"])
-        )
-        return max(0.0, min(1.0, value))
+        return self._cache["bad_posture_y"]
 
     @bad_posture_y.setter
     def bad_posture_y(self, value: float):
-        self._settings.setValue("bad_posture_y", value)
+        self._write("bad_posture_y", value)
 
     @property
     def is_calibrated(self) -> bool:
-        return self._settings.value(
-            "is_calibrated", self.DEFAULTS["is_calibrated"], type=bool
-        )
+        return self._cache["is_calibrated"]
 
     @is_calibrated.setter
     def is_calibrated(self, value: bool):
-        self._settings.setValue("is_calibrated", value)
+        self._write("is_calibrated", value)
 
     def sync(self):
-        """Force write settings to disk."""
+        """Write pending changes to QSettings and force them to disk."""
+        for key, value in self._dirty.items():
+            self._settings.setValue(key, value)
+        self._dirty.clear()
+
+        if self._dirty_monitors:
+            self._settings.beginGroup("monitors")
+            for calibration in self._dirty_monitors.values():
+                self._settings.beginGroup(calibration.monitor_id)
+                self._settings.setValue("good_posture_y", calibration.good_posture_y)
+                self._settings.setValue("bad_posture_y", calibration.bad_posture_y)
+                self._settings.setValue("is_calibrated", calibration.is_calibrated)
+                self._settings.endGroup()
+            self._settings.endGroup()
+            self._dirty_monitors.clear()
+
+        self._settings.sync()
+
+    def reload(self) -> None:
+        """Discard unsynced changes and re-read every setting from disk."""
+        self._dirty.clear()
+        self._dirty_monitors.clear()
         self._settings.sync()
+        self._cache = {key: self._read(key) for key in self.DEFAULTS}
+        self._monitor_calibrations = None
 
     # Per-monitor calibration methods
 
+    def _get_monitor_calibrations(self) -> dict[str, MonitorCalibration | None]:
+        """Return every monitor's calibration, reading them all on first use."""
+        if self._monitor_calibrations is None:
+            self._monitor_calibrations = {}
+            self._settings.beginGroup("monitors")
+            for monitor_id in self._settings.childGroups():
+                self._read_monitor_calibration(monitor_id)
+            self._settings.endGroup()
+        return self._monitor_calibrations
+
     def get_monitor_calibration(self, monitor_id: str) -> MonitorCalibration | None:
         """Get calibration data for a specific monitor."""
-        self._settings.beginGroup("monitors")
-        self._settings.beginGroup(monitor_id)
+        return self._get_monitor_calibrations().get(monitor_id)
 
-        is_calibrated = self._settings.value("is_calibrated", False, type=bool)
-        if not is_calibrated:
-            self._settings.endGroup()
-            self._settings.endGroup()
-            return None
+    def _read_monitor_calibration(self, monitor_id: str) -> MonitorCalibration | None:
+        """Read and cache one monitor's calibration.
 
-        good_y = float(
-            self._settings.value("good_posture_y", self.DEFAULTS["good_posture_y"])
-        )
-        bad_y = float(
-            self._settings.value("bad_posture_y", self.DEFAULTS["bad_posture_y"])
-        )
+        Must be called from inside the "monitors" group.
+        """
+        self._settings.beginGroup(monitor_id)
 
-        self._settings.endGroup()
-        self._settings.endGroup()
+        calibration = None
+        if self._settings.value("is_calibrated", False, type=bool):
+            good_y = float(
+                self._settings.value("good_posture_y", self.DEFAULTS["good_posture_y"])
+            )
+            bad_y = float(
+                self._settings.value("bad_posture_y", self.DEFAULTS["bad_posture_y"])
+            )
+            calibration = MonitorCalibration(
+                monitor_id=monitor_id,
+                good_posture_y=_clamp(good_y),
+                bad_posture_y=_clamp(bad_y),
+                is_calibrated=True,
+            )
 
-        return MonitorCalibration(
-            monitor_id=monitor_id,
-            good_posture_y=max(0.0, min(1.0, good_y)),
-            bad_posture_y=max(0.0, min(1.0, bad_y)),
-            is_calibrated=True,
-        )
+        self._settings.endGroup()
+        self._monitor_calibrations[monitor_id] = calibration
+        return calibration
 
     def set_monitor_calibration(self, calibration: MonitorCalibration) -> None:
         """Store calibration data for a specific monitor."""
-        self._settings.beginGroup("monitors")
-        self._settings.beginGroup(calibration.monitor_id)
-
-        self._settings.setValue("good_posture_y", calibration.good_posture_y)
-        self._settings.setValue("bad_posture_y", calibration.bad_posture_y)
-        self._settings.setValue("is_calibrated", calibration.is_calibrated)
+        calibration = MonitorCalibration(
+            monitor_id=calibration.monitor_id,
+            good_posture_y=_clamp(float(calibration.good_posture_y)),
+            bad_posture_y=_clamp(float(calibration.bad_posture_y)),
+            is_calibrated=calibration.is_calibrated,
+        )
+        cached = calibration if calibration.is_calibrated else None
+        calibrations = self._get_monitor_calibrations()
+        # Skip the write when the stored calibration already matches
+        if calibrations.get(calibration.monitor_id) == cached:
+            return
 
-        self._settings.endGroup()
-        self._settings.endGroup()
+        calibrations[calibration.monitor_id] = cached
+        self._dirty_monitors[calibration.monitor_id] = calibration
 
     def get_all_monitor_calibrations(self) -> list[MonitorCalibration]:
         """Get calibration data for all calibrated monitors."""
-        calibrations = []
-
-        self._settings.beginGroup("monitors")
-        monitor_ids = self._settings.childGroups()
-        self._settings.endGroup()
-
-        for monitor_id in monitor_ids:
-            calibration = self.get_monitor_calibration(monitor_id)
-            if calibration is not None:
-                calibrations.append(calibration)
-
-        return calibrations
+        return [
+            calibration
+            for calibration in self._get_monitor_calibrations().values()
+            if calibration is not None
+        ]
 
     def has_any_calibration(self) -> bool:
         """Check if any monitor has been calibrated."""
         # Check per-monitor calibrations
-        calibrations = self.get_all_monitor_calibrations()
-        if calibrations:
+        if self.get_all_monitor_calibrations():
             return True
 
         # Fall back to legacy global calibration
@@ -188,7 +261,8 @@ class Settings:
     def migrate_legacy_calibration(self, primary_monitor_id: str) -> bool:
         """Migrate legacy global calibration to primary monitor.
 
-        Returns True if migration was performed, False otherwise.
+        Returns True if migration was performed, False otherwise. The
+        migrated calibration is written on the caller's next sync().
         """
         # Only migrate if there's legacy calibration and no per-monitor data
         if not self.is_calibrated:
@@ -206,5 +280,4 @@ class Settings:
             is_calibrated=True,
         )
         self.set_monitor_calibration(calibration)
-        self.sync()
         return True
@@ -1,5 +1,7 @@
+from functools import partial
+
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PyQt6.QtGui import QIcon, QAction, QDesktopServices
+from PyQt6.QtGui import QIcon, QAction, QActionGroup, QDesktopServices
 from PyQt6.QtCore import QObject, pyqtSignal, QUrl
 
 from .settings import get_monitor_id
@@ -25,27 +27,37 @@ class TrayIcon(QObject):
         ("High", 1.0),
     ]
 
+    ICON_NAMES = {
+        "good": "user-available",
+        "slouching": "user-busy",
+        "away": "user-away",
+    }
+
+    EXTENSION_URL = QUrl(
+        "https://extensions.gnome.org/extension/8010/postured-overlay/"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Theme lookups walk the icon directories, so resolve each icon once
+        self._icons = {
+            state: QIcon.fromTheme(name) for state, name in self.ICON_NAMES.items()
+        }
+
         self.tray = QSystemTrayIcon(self)
-        self.tray.setIcon(self._get_icon("good"))
+        self._posture_state = "good"
+        self.tray.setIcon(self._icons[self._posture_state])
         self.tray.setToolTip("Postured")
 
+        # (name, monitor ID) per screen, cleared by invalidate_screens()
+        self._screens: tuple[tuple[str, str], ...] | None = None
+
         self.menu = QMenu()
         self._build_menu()
         self.tray.setContextMenu(self.menu)
         self.tray.show()
 
-    def _get_icon(self, state: str) -> QIcon:
-        # Use theme icons as fallback
-        icons = {
-            "good": "user-available",
-            "slouching": "user-busy",
-            "away": "user-away",
-        }
-        return QIcon.fromTheme(icons.get(state, "user-available"))
-
     def _build_menu(self):
         self.status_action = QAction("Status: Starting...", self.menu)
         self.status_action.setEnabled(False)
@@ -56,9 +68,7 @@ class TrayIcon(QObject):
         self.enable_action = QAction("Enabled", self.menu)
         self.enable_action.setCheckable(True)
         self.enable_action.setChecked(True)
-        self.enable_action.triggered.connect(
-            lambda checked: self.enable_toggled.emit(checked)
-        )
+        self.enable_action.triggered.connect(self.enable_toggled)
         self.menu.addAction(self.enable_action)
 
         # Recalibrate - simple action for single monitor, submenu for multiple
@@ -68,49 +78,59 @@ class TrayIcon(QObject):
 
         self.recalibrate_menu = self.menu.addMenu("Recalibrate")
         self._calibrated_monitors: set[str] = set()
+        self._recalibrate_menu_key: tuple | None = None
+        self._monitor_labels: dict[tuple[str, bool, bool], str] = {}
+        self._monitor_actions: dict[str, QAction] = {}
+        self._recalibrate_all_action = QAction("All Monitors", self)
+        self._recalibrate_all_action.triggered.connect(self.recalibrate_requested.emit)
+        self._recalibrate_separator = QAction(self)
+        self._recalibrate_separator.setSeparator(True)
         self._rebuild_recalibrate_menu()
 
         self.camera_menu = self.menu.addMenu("Camera")
+        self._camera_menu_key: tuple | None = None
 
+        # Radio options are QActionGroups, which keep one action checked
         sensitivity_menu = self.menu.addMenu("Sensitivity")
-        self.sensitivity_actions = []
+        self._sensitivity_group = QActionGroup(self)
+        self.sensitivity_actions: dict[float, QAction] = {}
         for name, value in self.SENSITIVITY_OPTIONS:
             action = QAction(name, sensitivity_menu)
             action.setCheckable(True)
             action.setChecked(value == 0.85)  # Default: Medium
-            action.triggered.connect(
-                lambda checked, v=value: self._on_sensitivity_changed(v)
-            )
+            self._sensitivity_group.addAction(action)
+            action.triggered.connect(partial(self.sensitivity_changed.emit, value))
             sensitivity_menu.addAction(action)
-            self.sensitivity_actions.append((action, value))
+            self.sensitivity_actions[value] = action
 
         self.menu.addSeparator()
 
         self.lock_away_action = QAction("Lock when away", self.menu)
         self.lock_away_action.setCheckable(True)
         self.lock_away_action.setChecked(False)
-        self.lock_away_action.triggered.connect(
-            lambda checked: self.lock_when_away_toggled.emit(checked)
-        )
+        self.lock_away_action.triggered.connect(self.lock_when_away_toggled)
         self.menu.addAction(self.lock_away_action)
 
         self.menu.addSeparator()
 
         # Notification mode options (mutually exclusive)
+        notification_mode_group = QActionGroup(self)
         self.dim_screen_action = QAction("Dim screen when slouching", self.menu)
         self.dim_screen_action.setCheckable(True)
         self.dim_screen_action.setChecked(True)
         self.dim_screen_action.triggered.connect(
-            lambda: self._on_notification_mode_changed("dim_screen")
+            partial(self.notification_mode_changed.emit, "dim_screen")
         )
+        notification_mode_group.addAction(self.dim_screen_action)
         self.menu.addAction(self.dim_screen_action)
 
         self.led_blink_action = QAction("Blink LED when slouching", self.menu)
         self.led_blink_action.setCheckable(True)
         self.led_blink_action.setChecked(False)
         self.led_blink_action.triggered.connect(
-            lambda: self._on_notification_mode_changed("led_blink")
+            partial(self.notification_mode_changed.emit, "led_blink")
         )
+        notification_mode_group.addAction(self.led_blink_action)
         self.menu.addAction(self.led_blink_action)
 
         # GNOME extension install prompt (hidden by default)
@@ -127,15 +147,15 @@ class TrayIcon(QObject):
         quit_action.triggered.connect(self.quit_requested.emit)
         self.menu.addAction(quit_action)
 
-    def _on_sensitivity_changed(self, value: float):
-        for action, v in self.sensitivity_actions:
-            action.setChecked(v == value)
-        self.sensitivity_changed.emit(value)
-
     def _rebuild_recalibrate_menu(self):
         """Rebuild the recalibrate UI based on monitor count."""
-        app = QApplication.instance()
-        screens = app.screens() if app else []
+        screens = self._get_screens()
+
+        # Skip the rebuild when neither the monitors nor their calibration changed
+        key = (screens, frozenset(self._calibrated_monitors))
+        if key == self._recalibrate_menu_key:
+            return
+        self._recalibrate_menu_key = key
 
         if len(screens) <= 1:
             # Single monitor: show simple action, hide submenu
@@ -145,33 +165,73 @@ class TrayIcon(QObject):
             # Multiple monitors: hide simple action, show submenu
             self.recalibrate_action.setVisible(False)
             self.recalibrate_menu.menuAction().setVisible(True)
-
-            self.recalibrate_menu.clear()
-
-            # "All Monitors" option
-            all_action = QAction("All Monitors", self.recalibrate_menu)
-            all_action.triggered.connect(self.recalibrate_requested.emit)
-            self.recalibrate_menu.addAction(all_action)
-
-            self.recalibrate_menu.addSeparator()
-
-            # Individual monitor options
-            for i, screen in enumerate(screens):
-                monitor_id = get_monitor_id(screen)
-                is_calibrated = monitor_id in self._calibrated_monitors
-
-                # Format: "HDMI-1 (Primary) [✓]" or "DP-2 [ ]"
-                label = screen.name()
-                if i == 0:
-                    label += " (Primary)"
-                label += " [✓]" if is_calibrated else " [ ]"
-
-                action = QAction(label, self.recalibrate_menu)
+            self._populate_recalibrate_menu(screens)
+
+    def _get_screens(self) -> tuple[tuple[str, str], ...]:
+        """Return (name, monitor ID) for each screen, primary first."""
+        if self._screens is None:
+            app = QApplication.instance()
+            screens = app.screens() if app else []
+            self._screens = tuple(
+                (screen.name(), get_monitor_id(screen)) for screen in screens
+            )
+        return self._screens
+
+    def _populate_recalibrate_menu(self, screens: tuple[tuple[str, str], ...]):
+        """Fill the recalibrate submenu with an entry per monitor."""
+        actions = [self._recalibrate_all_action, self._recalibrate_separator]
+
+        # Individual monitor options, reusing each monitor's action across
+        # rebuilds. They're owned by the tray rather than the submenu, so
+        # clear() detaches them without deleting them.
+        for i, (name, monitor_id) in enumerate(screens):
+            is_calibrated = monitor_id in self._calibrated_monitors
+            label = self._monitor_label(name, i == 0, is_calibrated)
+
+            action = self._monitor_actions.get(monitor_id)
+            if action is None:
+                action = QAction(self)
                 action.triggered.connect(
-                    lambda checked,
-                    mid=monitor_id: self.recalibrate_monitor_requested.emit(mid)
+                    partial(self.recalibrate_monitor_requested.emit, monitor_id)
                 )
-                self.recalibrate_menu.addAction(action)
+                self._monitor_actions[monitor_id] = action
+            action.setText(label)
+            actions.append(action)
+
+        self._replace_menu_actions(self.recalibrate_menu, actions)
+
+        # Drop actions for monitors that are gone so the pool stays bounded
+        current_ids = {monitor_id for _, monitor_id in screens}
+        for monitor_id in self._monitor_actions.keys() - current_ids:
+            action = self._monitor_actions.pop(monitor_id)
+            action.triggered.disconnect()
+            action.deleteLater()
+
+    def _monitor_label(self, name: str, is_primary: bool, is_calibrated: bool) -> str:
+        """Return the recalibrate menu label for a monitor, formatting it once."""
+        key = (name, is_primary, is_calibrated)
+        label = self._monitor_labels.get(key)
+        if label is None:
+            # Format: "HDMI-1 (Primary) [✓]" or "DP-2 [ ]"
+            label = name
+            if is_primary:
+                label += " (Primary)"
+            label += " [✓]" if is_calibrated else " [ ]"
+            self._monitor_labels[key] = label
+        return label
+
+    @staticmethod
+    def _replace_menu_actions(menu: QMenu, actions: list[QAction]):
+        """Swap a menu's actions for new ones with a single relayout."""
+        menu.setUpdatesEnabled(False)
+        menu.clear()
+        menu.addActions(actions)
+        menu.setUpdatesEnabled(True)
+
+    def invalidate_screens(self):
+        """Re-read the screens after they are added, removed or resized."""
+        self._screens = None
+        self._rebuild_recalibrate_menu()
 
     def update_monitor_calibrations(self, calibrated_monitor_ids: set[str]):
         """Update which monitors are calibrated and rebuild menu."""
@@ -187,15 +247,25 @@ class TrayIcon(QObject):
 
     def set_posture_state(self, state: str):
         """Update icon based on posture state ('good', 'slouching', 'away')."""
-        self.tray.setIcon(self._get_icon(state))
+        # setIcon pushes the icon to the tray host even when it is unchanged
+        if state == self._posture_state:
+            return
+        self._posture_state = state
+        self.tray.setIcon(self._icons.get(state, self._icons["good"]))
 
     def update_cameras(self, cameras: list[tuple[int, str]], current: int):
-        self.camera_menu.clear()
+        # Skip the rebuild when neither the camera list nor the selection changed
+        key = (tuple(cameras), current)
+        if key == self._camera_menu_key:
+            return
+        self._camera_menu_key = key
+
         if not cameras:
             action = QAction("No cameras found", self.camera_menu)
             action.setEnabled(False)
-            self.camera_menu.addAction(action)
+            self._replace_menu_actions(self.camera_menu, [action])
             return
+        actions = []
         single_camera = len(cameras) == 1
         for index, name in cameras:
             action = QAction(name, self.camera_menu)
@@ -204,10 +274,9 @@ class TrayIcon(QObject):
             else:
                 action.setCheckable(True)
                 action.setChecked(index == current)
-                action.triggered.connect(
-                    lambda checked, i=index: self.camera_changed.emit(i)
-                )
-            self.camera_menu.addAction(action)
+                action.triggered.connect(partial(self.camera_changed.emit, index))
+            actions.append(action)
+        self._replace_menu_actions(self.camera_menu, actions)
 
     def show_gnome_extension_prompt(self, show: bool = True):
         """Show or hide the GNOME extension install prompt."""
@@ -215,15 +284,7 @@ class TrayIcon(QObject):
 
     def _open_extension_page(self):
         """Open the GNOME extensions page for postured-overlay."""
-        QDesktopServices.openUrl(
-            QUrl("https://extensions.gnome.org/extension/8010/postured-overlay/")
-        )
-
-    def _on_notification_mode_changed(self, mode: str):
-        """Handle notification mode radio button selection."""
-        self.dim_screen_action.setChecked(mode == "dim_screen")
-        self.led_blink_action.setChecked(mode == "led_blink")
-        self.notification_mode_changed.emit(mode)
+        QDesktopServices.openUrl(self.EXTENSION_URL)
 
     def set_lock_when_away(self, enabled: bool):
         """Update the lock when away checkbox state."""
@@ -231,10 +292,17 @@ class TrayIcon(QObject):
 
     def set_sensitivity(self, value: float):
         """Update the sensitivity radio button selection."""
-        for action, v in self.sensitivity_actions:
-            action.setChecked(v == value)
+        action = self.sensitivity_actions.get(value)
+        if action is not None:
+            action.setChecked(True)
+        else:
+            checked = self._sensitivity_group.checkedAction()
+            if checked is not None:
+                checked.setChecked(False)
 
     def set_notification_mode(self, mode: str):
         """Update notification mode checkbox states."""
-        self.dim_screen_action.setChecked(mode == "dim_screen")
-        self.led_blink_action.setChecked(mode == "led_blink")
+        if mode == "led_blink":
+            self.led_blink_action.setChecked(True)
+        else:
+            self.dim_screen_action.setChecked(True)
@@ -1,12 +1,12 @@
 """Shared pytest fixtures for postured tests."""
 
 from dataclasses import dataclass, field
-from collections import deque
+from typing import ClassVar
 
 import pytest
 
 
-@dataclass
+@dataclass(slots=True)
 class MockAppState:
     """Mimics Application state for isolated algorithm testing."""
 
@@ -24,26 +24,28 @@ class MockAppState:
     consecutive_bad_frames: int = 0
     consecutive_good_frames: int = 0
     consecutive_no_detection: int = 0
+    _threshold_key: tuple | None = None
+    _thresholds: tuple = (0.0, 0.0, 0.0, 0.0)
 
     # Constants
-    FRAME_THRESHOLD: int = 8
-    AWAY_THRESHOLD: int = 15
-    HYSTERESIS_FACTOR: float = 0.5
-    DEAD_ZONE: float = 0.03
+    FRAME_THRESHOLD: ClassVar[int] = 8
+    AWAY_THRESHOLD: ClassVar[int] = 15
+    HYSTERESIS_FACTOR: ClassVar[float] = 0.5
+    DEAD_ZONE: ClassVar[float] = 0.03
 
 
-@dataclass
+@dataclass(slots=True)
 class MockOverlayState:
     """Mimics Overlay state for isolated opacity testing."""
 
     current_opacity: float = 0.0
     target_opacity: float = 0.0
 
-    EASE_IN_RATE: float = 0.015
-    EASE_OUT_RATE: float = 0.047
+    EASE_IN_RATE: ClassVar[float] = 0.015
+    EASE_OUT_RATE: ClassVar[float] = 0.047
 
 
-@dataclass
+@dataclass(slots=True)
 class MockCalibrationState:
     """Mimics CalibrationWindow state for calibration testing."""
 
@@ -51,26 +53,50 @@ class MockCalibrationState:
     captured_values: list = field(default_factory=list)
     current_nose_y: float = 0.5
 
-    POSITIONS: list = field(default_factory=lambda: ["TOP", "BOTTOM"])
+    POSITIONS: ClassVar[tuple[str, ...]] = ("TOP", "BOTTOM")
 
 
-@dataclass
+@dataclass(slots=True)
 class MockPoseWorkerState:
-    """Mimics PoseWorker state for smoothing tests."""
-
-    nose_y_history: deque = field(default_factory=lambda: deque(maxlen=5))
-    nose_x_history: deque = field(default_factory=lambda: deque(maxlen=5))
-    SMOOTHING_WINDOW: int = 5
-
-
-@dataclass
+    """Mimics PoseWorker state for smoothing and result handling tests."""
+
+    # Preallocated ring buffers with a running sum of their contents; index
+    # is the next slot, count the filled slots
+    nose_y_history: list[float] = field(default_factory=lambda: [0.0] * 5)
+    nose_y_sum: float = 0.0
+    nose_y_index: int = 0
+    nose_y_count: int = 0
+    nose_x_history: list[float] = field(default_factory=lambda: [0.0] * 5)
+    nose_x_sum: float = 0.0
+    nose_x_index: int = 0
+    nose_x_count: int = 0
+    # Stop flag, first submitted frame timestamp, and signals emitted so far
+    stopped: bool = False
+    first_timestamp_ms: int | None = None
+    emitted: list[tuple] = field(default_factory=list)
+    SMOOTHING_WINDOW: ClassVar[int] = 5
+
+
+@dataclass(slots=True)
+class MockCameraRecoveryState:
+    """Mimics PoseWorker's camera failure counters for recovery tests."""
+
+    consecutive_failures: int = 0
+    failed_checks: int = 0
+    camera_lost: bool = False
+    reopens: int = 0
+    MAX_CONSECUTIVE_FAILURES: ClassVar[int] = 30
+    REOPEN_AFTER_CHECKS: ClassVar[int] = 3
+
+
+@dataclass(slots=True)
 class MockMonitorDetectorState:
     """Mimics MonitorDetector state for gaze detection tests."""
 
     _current_monitor_id: str | None = None
     _pending_monitor_id: str | None = None
     _pending_frames: int = 0
-    HYSTERESIS_FRAMES: int = 5
+    HYSTERESIS_FRAMES: ClassVar[int] = 5
 
 
 @pytest.fixture
@@ -97,6 +123,12 @@ def mock_pose_worker_state():
     return MockPoseWorkerState()
 
 
+@pytest.fixture
+def mock_camera_recovery_state():
+    """Provides a fresh MockCameraRecoveryState for each test."""
+    return MockCameraRecoveryState()
+
+
 @pytest.fixture
 def mock_monitor_detector_state():
     """Provides a fresh MockMonitorDetectorState for each test."""
@@ -122,5 +154,11 @@ def mock_qsettings(tmp_path, monkeypatch):
             # Use IniFormat with our temp path
             super().__init__(str(config_file), original_qsettings.Format.IniFormat)
 
-    monkeypatch.setattr("PyQt6.QtCore.QSettings", MockQSettings)
+    # Patch the name settings.py uses, so it holds however early the module
+    # was first imported; tests can import Settings wherever they like
+    import postured.settings
+
+    monkeypatch.setattr(postured.settings, "QSettings", MockQSettings)
+    # Drop the shared instance so each test opens its own config
+    monkeypatch.setattr(postured.settings, "_qsettings", None)
     return config_file
@@ -90,10 +90,10 @@ class TestValueCapture:
         assert state.captured_values == [0.35, 0.62]
 
     def test_positions_list_has_two_entries(self, mock_calibration_state):
-        """POSITIONS list contains 2 positions."""
+        """POSITIONS contains 2 positions."""
         state = mock_calibration_state
         assert len(state.POSITIONS) == 2
-        assert state.POSITIONS == ["TOP", "BOTTOM"]
+        assert state.POSITIONS == ("TOP", "BOTTOM")
 
 
 class TestEdgeCases:
@@ -0,0 +1,140 @@
+"""Tests for camera listing from v4l2-ctl output."""
+
+import subprocess
+
+LIST_DEVICES = """\
+bcm2835-codec-decode (platform:bcm2835-codec):
+\t/dev/video10
+\t/dev/video11
+\t/dev/video12
+\t/dev/media2
+
+Dummy video device (0x0000) (platform:v4l2loopback-000):
+\t/dev/video20
+
+HD Webcam: HD Webcam (usb-0000:00:14.0-6):
+\t/dev/video0
+\t/dev/video1
+\t/dev/media0
+
+"""
+
+CAPTURE_INFO = """\
+Driver Info:
+\tDriver name      : uvcvideo
+\tCard type        : HD Webcam: HD Webcam
+\tCapabilities     : 0x84a00001
+\t\tVideo Capture
+\t\tMetadata Capture
+\t\tStreaming
+\t\tDevice Capabilities
+\tDevice Caps      : 0x04200001
+\t\tVideo Capture
+\t\tStreaming
+Media Driver Info:
+\tDriver name      : uvcvideo
+"""
+
+METADATA_INFO = """\
+Driver Info:
+\tDriver name      : uvcvideo
+\tCapabilities     : 0x84a00001
+\t\tVideo Capture
+\t\tMetadata Capture
+\t\tStreaming
+\t\tDevice Capabilities
+\tDevice Caps      : 0x04a00000
+\t\tMetadata Capture
+\t\tStreaming
+"""
+
+CODEC_INFO = """\
+Driver Info:
+\tDriver name      : bcm2835-codec
+\tCapabilities     : 0x84204000
+\t\tVideo Memory-to-Memory Multiplanar
+\t\tStreaming
+\t\tDevice Capabilities
+\tDevice Caps      : 0x04204000
+\t\tVideo Memory-to-Memory Multiplanar
+\t\tStreaming
+"""
+
+LOOPBACK_INFO = """\
+Driver Info:
+\tDriver name      : v4l2 loopback
+\tCapabilities     : 0x85200002
+\t\tVideo Output
+\t\tStreaming
+\t\tDevice Capabilities
+\tDevice Caps      : 0x05200002
+\t\tVideo Output
+\t\tStreaming
+"""
+
+
+class TestParseListDevices:
+    """Test parsing of `v4l2-ctl --list-devices` output."""
+
+    def test_groups_video_nodes_by_device(self):
+        """Each header collects its /dev/videoN nodes; media nodes are skipped."""
+        from postured.pose_detector import PoseDetector
+
+        devices = PoseDetector._parse_v4l2_devices(LIST_DEVICES)
+
+        assert devices == [
+            ("bcm2835-codec-decode", [10, 11, 12]),
+            ("Dummy video device (0x0000)", [20]),
+            ("HD Webcam: HD Webcam", [0, 1]),
+        ]
+
+    def test_empty_output(self):
+        """No output yields no devices."""
+        from postured.pose_detector import PoseDetector
+
+        assert PoseDetector._parse_v4l2_devices("") == []
+
+
+class TestVideoCaptureCapability:
+    """Test the Device Caps check on `v4l2-ctl --info` output."""
+
+    def test_capture_node(self):
+        """A node whose Device Caps list Video Capture is a camera."""
+        from postured.pose_detector import PoseDetector
+
+        assert PoseDetector._has_video_capture(CAPTURE_INFO) is True
+
+    def test_metadata_node_ignores_driver_capabilities(self):
+        """Only Device Caps count, not the driver-wide Capabilities list."""
+        from postured.pose_detector import PoseDetector
+
+        assert PoseDetector._has_video_capture(METADATA_INFO) is False
+
+    def test_codec_and_loopback_rejected(self):
+        """Memory-to-memory codecs and output-only loopback nodes are not."""
+        from postured.pose_detector import PoseDetector
+
+        assert PoseDetector._has_video_capture(CODEC_INFO) is False
+        assert PoseDetector._has_video_capture(LOOPBACK_INFO) is False
+
+
+def test_available_cameras_lists_only_capture_nodes(monkeypatch):
+    """Codecs and output-only loopback nodes stay out of the camera list."""
+    from postured.pose_detector import PoseDetector
+
+    infos = {
+        "/dev/video0": CAPTURE_INFO,
+        "/dev/video1": METADATA_INFO,
+        "/dev/video20": LOOPBACK_INFO,
+    }
+
+    def fake_run(args, **kwargs):
+        if args[1] == "--list-devices":
+            stdout = LIST_DEVICES
+        else:
+            stdout = infos.get(args[2], CODEC_INFO)
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert PoseDetector.available_cameras() == [(0, "HD Webcam: HD Webcam")]
@@ -0,0 +1,84 @@
+"""Tests for camera failure counting and reopen decisions."""
+
+from conftest import MockCameraRecoveryState
+
+
+def process_frame(state: MockCameraRecoveryState, frame_ok: bool):
+    """Extracted failure handling from the PoseWorker.run() loop.
+
+    A frame is not ok when the read failed or the frame was blank.
+    """
+    if not frame_ok:
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= state.MAX_CONSECUTIVE_FAILURES:
+            state.camera_lost = True
+            state.failed_checks += 1
+            if state.failed_checks >= state.REOPEN_AFTER_CHECKS:
+                state.failed_checks = 0
+                state.reopens += 1
+        return
+
+    state.camera_lost = False
+    state.consecutive_failures = 0
+    state.failed_checks = 0
+
+
+def fail(state: MockCameraRecoveryState, frames: int):
+    """Feed a run of failed frames."""
+    for _ in range(frames):
+        process_frame(state, False)
+
+
+class TestReopen:
+    """Test when a failing camera gets reopened."""
+
+    def test_no_reopen_before_camera_lost(self, mock_camera_recovery_state):
+        """Failures below MAX_CONSECUTIVE_FAILURES never reopen the camera."""
+        state = mock_camera_recovery_state
+
+        fail(state, state.MAX_CONSECUTIVE_FAILURES - 1)
+
+        assert not state.camera_lost
+        assert state.reopens == 0
+
+    def test_single_failed_check_does_not_reopen(self, mock_camera_recovery_state):
+        """One failed recovery check is treated as a transient hiccup."""
+        state = mock_camera_recovery_state
+
+        fail(state, state.MAX_CONSECUTIVE_FAILURES)
+
+        assert state.camera_lost
+        assert state.failed_checks == 1
+        assert state.reopens == 0
+
+    def test_reopens_after_consecutive_failed_checks(self, mock_camera_recovery_state):
+        """The camera is reopened once REOPEN_AFTER_CHECKS checks fail in a row."""
+        state = mock_camera_recovery_state
+
+        fail(state, state.MAX_CONSECUTIVE_FAILURES + state.REOPEN_AFTER_CHECKS - 1)
+
+        assert state.reopens == 1
+        assert state.failed_checks == 0
+
+    def test_keeps_reopening_while_failing(self, mock_camera_recovery_state):
+        """A camera that stays blank is reopened every REOPEN_AFTER_CHECKS checks."""
+        state = mock_camera_recovery_state
+
+        fail(state, state.MAX_CONSECUTIVE_FAILURES - 1 + 3 * state.REOPEN_AFTER_CHECKS)
+
+        assert state.reopens == 3
+
+    def test_good_frame_resets_counters(self, mock_camera_recovery_state):
+        """A good frame clears the failed check count."""
+        state = mock_camera_recovery_state
+        fail(state, state.MAX_CONSECUTIVE_FAILURES + 1)
+        assert state.failed_checks == 2
+
+        process_frame(state, True)
+
+        assert state.failed_checks == 0
+        assert state.consecutive_failures == 0
+        assert not state.camera_lost
+
+        fail(state, state.MAX_CONSECUTIVE_FAILURES + 1)
+        assert state.reopens == 0
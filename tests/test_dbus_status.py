@@ -1,20 +1,21 @@
 """Tests for D-Bus status building."""
 
+import itertools
 
 from conftest import MockAppState
 
+_STATES_BY_PRIORITY = ("good", "slouching", "away", "calibrating", "paused")
+
 
 def get_state_string(app: MockAppState) -> str:
     """Extracted state string logic from PosturedDBusAdaptor._get_state_string()."""
-    if not app.is_enabled:
-        return "paused"
-    if app.is_calibrating:
-        return "calibrating"
-    if app.consecutive_no_detection >= app.AWAY_THRESHOLD:
-        return "away"
-    if app.is_slouching:
-        return "slouching"
-    return "good"
+    flags = (
+        (not app.is_enabled) << 3
+        | app.is_calibrating << 2
+        | (app.consecutive_no_detection >= app.AWAY_THRESHOLD) << 1
+        | app.is_slouching
+    )
+    return _STATES_BY_PRIORITY[flags.bit_length()]
 
 
 def build_status_dict(app: MockAppState) -> dict:
@@ -118,6 +119,30 @@ class TestStatePriority:
 
         assert result == "away"
 
+    def test_priority_order_for_all_combinations(self, mock_app_state):
+        """Every combination resolves to its highest-priority state."""
+        state = mock_app_state
+
+        for enabled, calibrating, away, slouching in itertools.product(
+            (True, False), repeat=4
+        ):
+            state.is_enabled = enabled
+            state.is_calibrating = calibrating
+            state.consecutive_no_detection = state.AWAY_THRESHOLD if away else 0
+            state.is_slouching = slouching
+
+            if not enabled:
+                expected = "paused"
+            elif calibrating:
+                expected = "calibrating"
+            elif away:
+                expected = "away"
+            elif slouching:
+                expected = "slouching"
+            else:
+                expected = "good"
+            assert get_state_string(state) == expected
+
 
 class TestBuildStatusDict:
     """Test _build_status_dict() output."""
@@ -0,0 +1,44 @@
+"""Tests for camera frame preprocessing."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def worker():
+    """PoseWorker without a landmarker; preprocessing never touches it."""
+    from postured.pose_detector import PoseWorker
+
+    return PoseWorker(None, 0)
+
+
+def test_variance_tracks_full_frame_std(worker):
+    """The strided subsample measures about the same spread as every pixel."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+    assert worker._frame_variance(frame) == pytest.approx(frame.std(), rel=0.01)
+
+
+def test_fine_detail_not_treated_as_blank(worker):
+    """Spread is sampled before downscaling, which would average detail away."""
+    # 1px checkerboard: std 30 at full size, near 0 once INTER_AREA averages it,
+    # and 0 under an even stride that only lands on one colour
+    checker = (np.indices((720, 1280)).sum(axis=0) % 2 * 60).astype(np.uint8)
+    frame = np.repeat(checker[:, :, None], 3, axis=2)
+
+    frame_variance, rgb = worker._preprocess(frame)
+
+    assert frame_variance == pytest.approx(30.0)
+    assert rgb is not None
+    assert rgb.shape == (180, 320, 3)
+
+
+def test_uniform_frame_is_blank(worker):
+    """A uniform frame (e.g. privacy shutter) is rejected before conversion."""
+    frame = np.full((720, 1280, 3), 12, dtype=np.uint8)
+
+    frame_variance, rgb = worker._preprocess(frame)
+
+    assert frame_variance < worker.MIN_FRAME_VARIANCE
+    assert rgb is None
@@ -1,5 +1,7 @@
 """Tests for monitor detection algorithm."""
 
+from bisect import bisect_right
+from operator import itemgetter
 from unittest.mock import MagicMock
 from conftest import MockMonitorDetectorState
 
@@ -16,50 +18,65 @@ def create_mock_screen(name: str, x: int, width: int, height: int = 1080):
     return screen
 
 
-def detect_monitor_algorithm(nose_x: float, screens: list) -> str:
-    """Extracted monitor detection algorithm from MonitorDetector._detect_monitor()."""
-    # Mirror the X coordinate (camera is mirrored)
-    mirrored_x = 1.0 - nose_x
+def build_layout(screens: list) -> tuple[list[int], list[str], int]:
+    """Extracted layout cache from MonitorDetector._build_layout().
+
+    Returns (right edges, monitor IDs, total width), sorted left to right.
+    """
+    # Read each screen's geometry once, sorted by X position
+    layout = []
+    for screen in screens:
+        geometry = screen.geometry()
+        layout.append(
+            (geometry.x(), geometry.width(), geometry.height(), screen.name())
+        )
+    layout.sort(key=itemgetter(0))
 
-    # Sort screens by X position (left to right)
-    sorted_screens = sorted(screens, key=lambda s: s.geometry().x())
+    boundaries = []
+    cumulative_x = 0
+    for _, width, _, _ in layout:
+        cumulative_x += width
+        boundaries.append(cumulative_x)
 
-    # Calculate total desktop width
-    total_width = sum(s.geometry().width() for s in sorted_screens)
-    if total_width == 0:
-        return f"{sorted_screens[0].name()}_{sorted_screens[0].geometry().width()}x{sorted_screens[0].geometry().height()}"
+    labels = [f"{name}_{width}x{height}" for _, width, height, name in layout]
+    return boundaries, labels, cumulative_x
 
-    # Map mirrored_x to desktop coordinate
-    desktop_x = mirrored_x * total_width
 
-    # Find containing screen
-    cumulative_x = 0
-    for screen in sorted_screens:
-        screen_width = screen.geometry().width()
-        if desktop_x < cumulative_x + screen_width:
-            return f"{screen.name()}_{screen.geometry().width()}x{screen.geometry().height()}"
-        cumulative_x += screen_width
+def lookup_monitor(
+    nose_x: float, boundaries: list[int], labels: list[str], total_width: int
+) -> str:
+    """Extracted lookup from MonitorDetector._detect_monitor()."""
+    # Most setups have one screen, which wins regardless of position
+    if len(labels) == 1 or total_width == 0:
+        return labels[0]
 
-    # Fallback to last screen
-    last = sorted_screens[-1]
-    return f"{last.name()}_{last.geometry().width()}x{last.geometry().height()}"
+    # Mirror the X coordinate (camera is mirrored) and map to desktop
+    desktop_x = (1.0 - nose_x) * total_width
+
+    # First screen whose right edge lies past desktop_x, else the last one
+    index = bisect_right(boundaries, desktop_x)
+    return labels[min(index, len(labels) - 1)]
+
+
+def detect_monitor_algorithm(nose_x: float, screens: list) -> str:
+    """Build the layout and look up the monitor in one call."""
+    return lookup_monitor(nose_x, *build_layout(screens))
 
 
 def apply_hysteresis(state: MockMonitorDetectorState, detected: str) -> str | None:
     """Extracted hysteresis logic from MonitorDetector.update()."""
-    if detected != state._current_monitor_id:
-        if detected == state._pending_monitor_id:
-            state._pending_frames += 1
-            if state._pending_frames >= state.HYSTERESIS_FRAMES:
-                state._current_monitor_id = detected
-                state._pending_monitor_id = None
-                state._pending_frames = 0
-        else:
-            state._pending_monitor_id = detected
-            state._pending_frames = 1
-    else:
+    if detected == state._current_monitor_id:
         state._pending_monitor_id = None
         state._pending_frames = 0
+    elif detected == state._pending_monitor_id:
+        state._pending_frames += 1
+        if state._pending_frames >= state.HYSTERESIS_FRAMES:
+            state._current_monitor_id = detected
+            state._pending_monitor_id = None
+            state._pending_frames = 0
+    else:
+        state._pending_monitor_id = detected
+        state._pending_frames = 1
 
     return state._current_monitor_id
 
@@ -154,6 +171,40 @@ class TestMonitorDetectionAlgorithm:
         assert result == "HDMI-1_1920x1080"
 
 
+class TestLayoutCache:
+    """Test that a cached layout answers like a fresh one."""
+
+    def test_layout_sorted_with_cumulative_edges(self):
+        """Layout is sorted left to right with cumulative right edges."""
+        screens = [
+            create_mock_screen("DP-2", 1920, 2560, 1440),
+            create_mock_screen("HDMI-1", 0, 1920),
+            create_mock_screen("DP-3", 4480, 1280, 1024),
+        ]
+        layout = build_layout(screens)
+        assert layout == (
+            [1920, 4480, 5760],
+            ["HDMI-1_1920x1080", "DP-2_2560x1440", "DP-3_1280x1024"],
+            5760,
+        )
+
+        # One layout serves every lookup until the screens change
+        assert lookup_monitor(1.0, *layout) == "HDMI-1_1920x1080"
+        assert lookup_monitor(0.5, *layout) == "DP-2_2560x1440"
+        assert lookup_monitor(0.0, *layout) == "DP-3_1280x1024"
+
+    def test_boundary_belongs_to_right_screen(self):
+        """A position exactly on a right edge falls to the next screen."""
+        layout = build_layout(
+            [
+                create_mock_screen("HDMI-1", 0, 1920),
+                create_mock_screen("DP-2", 1920, 1920),
+            ]
+        )
+        # mirrored 0.5 * 3840 = 1920, the left screen's right edge
+        assert lookup_monitor(0.5, *layout) == "DP-2_1920x1080"
+
+
 class TestHysteresis:
     """Test hysteresis behavior for monitor switching."""
 
@@ -1,5 +1,7 @@
-"""Tests for Overlay opacity transition math."""
+"""Tests for Overlay opacity transition math and backend checks."""
 
+import math
+import subprocess
 
 from conftest import MockOverlayState
 
@@ -10,17 +12,15 @@ def update_opacity(state: MockOverlayState) -> bool:
 
     Returns True if opacity was updated, False if already converged.
     """
-    if abs(state.current_opacity - state.target_opacity) < 0.001:
+    delta = state.target_opacity - state.current_opacity
+    if -0.001 < delta < 0.001:
         return False
 
-    if state.current_opacity < state.target_opacity:
-        state.current_opacity = min(
-            state.current_opacity + state.EASE_IN_RATE, state.target_opacity
-        )
+    rate = state.EASE_IN_RATE if delta > 0 else state.EASE_OUT_RATE
+    if -rate <= delta <= rate:
+        state.current_opacity = state.target_opacity
     else:
-        state.current_opacity = max(
-            state.current_opacity - state.EASE_OUT_RATE, state.target_opacity
-        )
+        state.current_opacity += math.copysign(rate, delta)
 
     return True
 
@@ -153,3 +153,69 @@ class TestBounds:
 
         set_target_opacity(state, 0.5)
         assert state.target_opacity == 0.5
+
+
+class TestTimerStart:
+    """Test when set_target_opacity wakes the transition timer."""
+
+    @staticmethod
+    def needs_transition(state: MockOverlayState) -> bool:
+        """Mirrors the timer start check in Overlay.set_target_opacity."""
+        delta = state.target_opacity - state.current_opacity
+        return not -0.001 < delta < 0.001
+
+    def test_idle_at_zero_stays_idle(self, mock_overlay_state):
+        """Repeated set_target_opacity(0) on good frames does not start the timer."""
+        state = mock_overlay_state
+        state.current_opacity = 0.0
+        state.target_opacity = 0.0
+
+        assert not self.needs_transition(state)
+
+    def test_converged_target_stays_idle(self, mock_overlay_state):
+        """Re-sending the current level (within tolerance) does not start the timer."""
+        state = mock_overlay_state
+        state.current_opacity = 0.5
+        state.target_opacity = 0.5005
+
+        assert not self.needs_transition(state)
+
+    def test_new_target_starts_timer(self, mock_overlay_state):
+        """A target at least 0.001 away from the current level starts the timer."""
+        state = mock_overlay_state
+        state.current_opacity = 0.0
+        state.target_opacity = 0.1
+        assert self.needs_transition(state)
+
+        state.current_opacity = 0.5
+        state.target_opacity = 0.0
+        assert self.needs_transition(state)
+
+
+class TestLayerShellCheck:
+    """Test caching of the layer-shell support check."""
+
+    def test_timeout_not_cached(self, monkeypatch):
+        """A timed-out check is retried; a definitive answer is then cached."""
+        from postured import overlay
+
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise subprocess.TimeoutExpired(args, kwargs["timeout"])
+            return subprocess.CompletedProcess(args, 0)
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        overlay._probe_layer_shell.cache_clear()
+        try:
+            assert overlay._check_layer_shell() == (
+                False,
+                "layer-shell check timed out",
+            )
+            assert overlay._check_layer_shell() == (True, "supported")
+            assert overlay._check_layer_shell() == (True, "supported")
+            assert len(calls) == 2
+        finally:
+            overlay._probe_layer_shell.cache_clear()
@@ -0,0 +1,131 @@
+"""Tests for filtering of asynchronous pose landmarker results."""
+
+from types import SimpleNamespace
+
+from conftest import MockPoseWorkerState
+
+NOSE_IDX = 0  # PoseLandmark.NOSE
+
+
+def add(state: MockPoseWorkerState, axis: str, value: float) -> float:
+    """Extracted _RollingMean.add() logic for the nose_<axis> window."""
+    history = getattr(state, f"nose_{axis}_history")
+    index = getattr(state, f"nose_{axis}_index")
+    total = getattr(state, f"nose_{axis}_sum") + value - history[index]
+    history[index] = value
+    count = min(getattr(state, f"nose_{axis}_count") + 1, state.SMOOTHING_WINDOW)
+    setattr(state, f"nose_{axis}_sum", total)
+    setattr(state, f"nose_{axis}_index", (index + 1) % state.SMOOTHING_WINDOW)
+    setattr(state, f"nose_{axis}_count", count)
+    return total / count
+
+
+def handle_result(state: MockPoseWorkerState, pose_landmarks: list, timestamp_ms: int):
+    """Extracted result filtering logic from PoseWorker.handle_result()."""
+    # Ignore results still in flight from before this worker started
+    if state.stopped or state.first_timestamp_ms is None:
+        return
+    if timestamp_ms < state.first_timestamp_ms:
+        return
+
+    if pose_landmarks:
+        nose = pose_landmarks[0][NOSE_IDX]
+        state.emitted.append(
+            ("pose_detected", add(state, "y", nose.y), add(state, "x", nose.x))
+        )
+    else:
+        state.emitted.append(("no_detection",))
+
+
+def on_result(worker: MockPoseWorkerState | None, pose_landmarks, timestamp_ms):
+    """Extracted forwarding logic from PoseDetector._on_result()."""
+    if worker is not None:
+        handle_result(worker, pose_landmarks, timestamp_ms)
+
+
+def pose(y: float, x: float) -> list:
+    """One detected pose whose nose is at (x, y)."""
+    return [[SimpleNamespace(x=x, y=y)]]
+
+
+class TestStaleResults:
+    """Test that results not belonging to the running worker are dropped."""
+
+    def test_result_before_first_frame_dropped(self, mock_pose_worker_state):
+        """Nothing is accepted until the worker has submitted a frame."""
+        state = mock_pose_worker_state
+
+        handle_result(state, pose(0.5, 0.5), 1000)
+
+        assert state.emitted == []
+        assert state.nose_y_count == 0
+
+    def test_result_older_than_first_frame_dropped(self, mock_pose_worker_state):
+        """A result from a previous worker's frame leaves the window untouched."""
+        state = mock_pose_worker_state
+        state.first_timestamp_ms = 1000
+
+        handle_result(state, pose(0.9, 0.9), 999)
+        handle_result(state, [], 500)
+
+        assert state.emitted == []
+        assert state.nose_y_count == 0
+        assert state.nose_x_count == 0
+
+    def test_result_after_stop_dropped(self, mock_pose_worker_state):
+        """Results arriving after stop() are ignored."""
+        state = mock_pose_worker_state
+        state.first_timestamp_ms = 1000
+        state.stopped = True
+
+        handle_result(state, pose(0.5, 0.5), 1100)
+        handle_result(state, [], 1200)
+
+        assert state.emitted == []
+        assert state.nose_y_count == 0
+
+
+class TestFreshResults:
+    """Test handling of results for the worker's own frames."""
+
+    def test_pose_updates_means_and_emits(self, mock_pose_worker_state):
+        """A detected pose feeds both rolling means and emits their averages."""
+        state = mock_pose_worker_state
+        state.first_timestamp_ms = 1000
+
+        handle_result(state, pose(0.4, 0.2), 1000)
+        handle_result(state, pose(0.6, 0.4), 1100)
+
+        assert state.nose_y_count == 2
+        assert state.nose_x_count == 2
+        assert state.emitted[0] == ("pose_detected", 0.4, 0.2)
+        _, nose_y, nose_x = state.emitted[1]
+        assert nose_y == 0.5
+        assert abs(nose_x - 0.3) < 0.0001
+
+    def test_no_pose_emits_no_detection(self, mock_pose_worker_state):
+        """An empty result emits no_detection without touching the means."""
+        state = mock_pose_worker_state
+        state.first_timestamp_ms = 1000
+
+        handle_result(state, [], 1000)
+
+        assert state.emitted == [("no_detection",)]
+        assert state.nose_y_count == 0
+
+
+class TestForwarding:
+    """Test PoseDetector forwarding results to the active worker."""
+
+    def test_no_worker_ignores_result(self):
+        """A result arriving after the worker is gone is dropped quietly."""
+        on_result(None, pose(0.5, 0.5), 1000)
+
+    def test_active_worker_receives_result(self, mock_pose_worker_state):
+        """The active worker handles forwarded results."""
+        state = mock_pose_worker_state
+        state.first_timestamp_ms = 1000
+
+        on_result(state, pose(0.5, 0.5), 1000)
+
+        assert state.emitted == [("pose_detected", 0.5, 0.5)]
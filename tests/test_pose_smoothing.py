@@ -1,13 +1,24 @@
 """Tests for pose smoothing (rolling average calculation)."""
 
-
 from conftest import MockPoseWorkerState
 
 
 def smooth(state: MockPoseWorkerState, raw_y: float) -> float:
-    """Extracted smoothing logic from PoseWorker._smooth()."""
-    state.nose_y_history.append(raw_y)
-    return sum(state.nose_y_history) / len(state.nose_y_history)
+    """Extracted smoothing logic from PoseWorker._smooth_y() (_RollingMean.add)."""
+    # The slot being overwritten is zero until the window fills
+    state.nose_y_sum += raw_y - state.nose_y_history[state.nose_y_index]
+    state.nose_y_history[state.nose_y_index] = raw_y
+    state.nose_y_index = (state.nose_y_index + 1) % state.SMOOTHING_WINDOW
+    state.nose_y_count = min(state.nose_y_count + 1, state.SMOOTHING_WINDOW)
+    return state.nose_y_sum / state.nose_y_count
+
+
+def history(state: MockPoseWorkerState) -> list[float]:
+    """Window contents, oldest first."""
+    if state.nose_y_count < state.SMOOTHING_WINDOW:
+        return state.nose_y_history[: state.nose_y_count]
+    index = state.nose_y_index
+    return state.nose_y_history[index:] + state.nose_y_history[:index]
 
 
 class TestRollingAverage:
@@ -38,11 +49,11 @@ class TestRollingAverage:
         for v in values:
             smooth(state, v)
 
-        assert len(state.nose_y_history) == 5
+        assert len(history(state)) == 5
         # Last smooth call returns the average
         smooth(state, 0.5)  # This adds 6th value, drops first
         # Now window is [0.2, 0.3, 0.4, 0.5, 0.5]
-        assert len(state.nose_y_history) == 5
+        assert len(history(state)) == 5
 
 
 class TestWindowBehavior:
@@ -56,13 +67,13 @@ class TestWindowBehavior:
         for _ in range(5):
             smooth(state, 0.5)
 
-        assert list(state.nose_y_history) == [0.5, 0.5, 0.5, 0.5, 0.5]
+        assert history(state) == [0.5, 0.5, 0.5, 0.5, 0.5]
 
         # Add new value, oldest should drop
         smooth(state, 1.0)
 
-        assert list(state.nose_y_history) == [0.5, 0.5, 0.5, 0.5, 1.0]
-        assert len(state.nose_y_history) == 5
+        assert history(state) == [0.5, 0.5, 0.5, 0.5, 1.0]
+        assert len(history(state)) == 5
 
     def test_smoothing_reduces_noise(self, mock_pose_worker_state):
         """Smoothing reduces the effect of noisy values."""
@@ -78,9 +89,19 @@ class TestWindowBehavior:
         # Result should be dampened: (0.5 + 0.5 + 0.5 + 0.5 + 1.0) / 5 = 0.6
         assert result == 0.6
 
+    def test_running_sum_matches_window(self, mock_pose_worker_state):
+        """Running sum tracks the window contents as values are evicted."""
+        state = mock_pose_worker_state
+
+        for v in [0.1, 0.9, 0.3, 0.7, 0.2, 0.8, 0.4, 0.6]:
+            result = smooth(state, v)
+
+        assert abs(state.nose_y_sum - sum(history(state))) < 1e-12
+        assert abs(result - sum(history(state)) / 5) < 1e-12
+
     def test_window_size_is_5(self, mock_pose_worker_state):
         """Window size is exactly 5."""
         state = mock_pose_worker_state
 
         assert state.SMOOTHING_WINDOW == 5
-        assert state.nose_y_history.maxlen == 5
+        assert len(state.nose_y_history) == 5
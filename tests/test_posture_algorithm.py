@@ -10,15 +10,32 @@ def evaluate_posture(state: MockAppState, current_y: float) -> tuple[float, bool
 
     Returns (target_opacity, is_bad_posture_frame).
     """
-    posture_range = abs(state.bad_posture_y - state.good_posture_y)
-    if posture_range < 0.01:
-        posture_range = 0.2
+    good_y = state.good_posture_y
+    bad_y = state.bad_posture_y
+    sensitivity = state.sensitivity
 
-    slouch_amount = current_y - state.bad_posture_y
-    base_threshold = state.DEAD_ZONE * posture_range * state.sensitivity
+    threshold_key = (good_y, bad_y, sensitivity)
+    if threshold_key != state._threshold_key:
+        posture_range = abs(bad_y - good_y)
+        if posture_range < 0.01:
+            posture_range = 0.2
 
-    enter_threshold = base_threshold
-    exit_threshold = base_threshold * state.HYSTERESIS_FACTOR
+        base_threshold = state.DEAD_ZONE * posture_range * sensitivity
+
+        enter_threshold = base_threshold
+        exit_threshold = base_threshold * state.HYSTERESIS_FACTOR
+        opacity_gain = 0.97 * sensitivity
+
+        state._threshold_key = threshold_key
+        state._thresholds = (
+            posture_range,
+            enter_threshold,
+            exit_threshold,
+            opacity_gain,
+        )
+    posture_range, enter_threshold, exit_threshold, opacity_gain = state._thresholds
+
+    slouch_amount = current_y - bad_y
 
     threshold = exit_threshold if state.is_slouching else enter_threshold
     is_bad_posture = slouch_amount > threshold
@@ -34,7 +51,7 @@ def evaluate_posture(state: MockAppState, current_y: float) -> tuple[float, bool
             severity = (slouch_amount - enter_threshold) / posture_range
             severity = max(0.0, min(1.0, severity))
             eased_severity = severity * severity
-            target_opacity = 0.03 + eased_severity * 0.97 * state.sensitivity
+            target_opacity = 0.03 + eased_severity * opacity_gain
     else:
         state.consecutive_good_frames += 1
         state.consecutive_bad_frames = 0
@@ -306,3 +323,28 @@ class TestEdgeCases:
         opacity, _ = evaluate_posture(state, 1.0)
         # Max opacity should be around 0.03 + 1 * 0.97 * 0.85 = 0.8545
         assert opacity <= 0.03 + 0.97 * state.sensitivity + 0.001
+
+
+class TestThresholdCache:
+    """Test that cached thresholds follow their inputs."""
+
+    def test_sensitivity_change_recomputes_thresholds(self, mock_app_state):
+        """Changing sensitivity between frames takes effect immediately."""
+        state = mock_app_state
+        # base_threshold = 0.03 * 0.2 * 0.85 = 0.0051
+        _, is_bad = evaluate_posture(state, 0.605)
+        assert is_bad is False
+
+        # base_threshold = 0.03 * 0.2 * 0.5 = 0.003
+        state.sensitivity = 0.5
+        _, is_bad = evaluate_posture(state, 0.605)
+        assert is_bad is True
+
+    def test_calibration_change_recomputes_thresholds(self, mock_app_state):
+        """Changing calibration between frames takes effect immediately."""
+        state = mock_app_state
+        evaluate_posture(state, 0.5)
+
+        state.bad_posture_y = 0.8
+        _, is_bad = evaluate_posture(state, 0.7)
+        assert is_bad is False
@@ -1,125 +1,153 @@
 """Tests for Settings class."""
 
-
-def test_default_sensitivity(mock_qsettings):
-    """Default sensitivity is returned when no config exists."""
+import pytest
+
+
+@pytest.mark.parametrize(
+    "attr, expected",
+    [
+        ("sensitivity", 0.85),
+        ("camera_index", 0),
+        ("lock_when_away", False),
+        ("notification_mode", "dim_screen"),
+        ("good_posture_y", 0.4),
+        ("bad_posture_y", 0.6),
+        ("is_calibrated", False),
+    ],
+)
+def test_default_values(mock_qsettings, attr, expected):
+    """Defaults are returned when no config exists."""
     from postured.settings import Settings
 
-    settings = Settings()
-    assert settings.sensitivity == 0.85
+    value = getattr(Settings(), attr)
+    assert value == expected
+    assert type(value) is type(expected)
 
 
-def test_default_camera_index(mock_qsettings):
-    """Default camera_index is returned when no config exists."""
+def test_notification_mode_validates(mock_qsettings):
+    """Invalid notification_mode falls back to default."""
     from postured.settings import Settings
 
     settings = Settings()
-    assert settings.camera_index == 0
-
+    settings.notification_mode = "invalid_value"
+    assert settings.notification_mode == "dim_screen"
 
-def test_default_lock_when_away(mock_qsettings):
-    """Default lock_when_away is False when no config exists."""
+    # Invalid values already on disk are rejected when loaded too
+    settings._settings.setValue("notification_mode", "invalid_value")
+    assert Settings().notification_mode == "dim_screen"
+
+
+@pytest.mark.parametrize(
+    "attr, value, expected",
+    [
+        ("sensitivity", -0.5, 0.1),
+        ("sensitivity", 2.0, 1.0),
+        ("camera_index", -5, 0),
+        ("good_posture_y", -0.5, 0.0),
+        ("bad_posture_y", -0.3, 0.0),
+        ("good_posture_y", 1.5, 1.0),
+        ("bad_posture_y", 2.0, 1.0),
+    ],
+)
+def test_values_clamped_on_read(mock_qsettings, attr, value, expected):
+    """Out-of-range values in the config file are clamped when loaded."""
     from postured.settings import Settings
 
-    settings = Settings()
-    assert settings.lock_when_away is False
+    # Store the raw value, bypassing the setters (simulating a hand-edited config)
+    Settings()._settings.setValue(attr, value)
 
+    assert getattr(Settings(), attr) == expected
 
-def test_default_notification_mode(mock_qsettings):
-    """Default notification_mode is dim_screen."""
-    from postured.settings import Settings
 
-    settings = Settings()
-    assert settings.notification_mode == "dim_screen"
-
-
-def test_notification_mode_validates(mock_qsettings):
-    """Invalid notification_mode falls back to default."""
+def test_sensitivity_clamped_on_write(mock_qsettings):
+    """Out-of-range values are clamped before they are stored."""
     from postured.settings import Settings
 
     settings = Settings()
-    settings.notification_mode = "invalid_value"
+    settings.sensitivity = 2.0
+    assert settings.sensitivity == 1.0
     settings.sync()
-
-    settings2 = Settings()
-    assert settings2.notification_mode == "dim_screen"
+    assert float(settings._settings.value("sensitivity")) == 1.0
 
 
-def test_default_posture_values(mock_qsettings):
-    """Default posture Y values are returned when no config exists."""
+def test_unchanged_value_not_rewritten(mock_qsettings, monkeypatch):
+    """Setting a value equal to the stored one skips the QSettings write."""
     from postured.settings import Settings
 
     settings = Settings()
-    assert settings.good_posture_y == 0.4
-    assert settings.bad_posture_y == 0.6
-
+    settings.sensitivity = 0.5
+    settings.sync()
 
-def test_default_is_calibrated(mock_qsettings):
-    """Default is_calibrated is False when no config exists."""
-    from postured.settings import Settings
+    writes = []
+    monkeypatch.setattr(
+        settings._settings, "setValue", lambda *args: writes.append(args)
+    )
+    settings.sensitivity = 0.5
+    settings.sync()
+    assert writes == []
 
-    settings = Settings()
-    assert settings.is_calibrated is False
+    settings.sensitivity = 0.6
+    settings.sync()
+    assert writes == [("sensitivity", 0.6)]
 
 
-def test_sensitivity_clamps_low(mock_qsettings):
-    """Sensitivity is clamped to minimum 0.1."""
+def test_writes_deferred_until_sync(mock_qsettings):
+    """Setters batch their changes; sync() hands them to QSettings at once."""
     from postured.settings import Settings
 
     settings = Settings()
-    settings.sensitivity = -0.5
+    stored = settings._settings.value("camera_index")
+    settings.camera_index = settings.camera_index + 1
+    assert settings._settings.value("camera_index") == stored
+
     settings.sync()
-    # Re-read to test clamping on read
-    settings2 = Settings()
-    assert settings2.sensitivity == 0.1
+    assert int(settings._settings.value("camera_index")) == settings.camera_index
+    assert settings._dirty == {}
 
 
-def test_sensitivity_clamps_high(mock_qsettings):
-    """Sensitivity is clamped to maximum 1.0."""
+def test_instances_share_qsettings(mock_qsettings):
+    """Settings instances reuse one QSettings rather than reopening the file."""
     from postured.settings import Settings
 
-    settings = Settings()
-    settings.sensitivity = 2.0
-    settings.sync()
-    settings2 = Settings()
-    assert settings2.sensitivity == 1.0
+    assert Settings()._settings is Settings()._settings
 
 
-def test_camera_index_clamps_negative(mock_qsettings):
-    """Camera index is clamped to minimum 0."""
-    from postured.settings import Settings
+def test_reload_discards_unsynced_changes(mock_qsettings):
+    """reload() re-reads from disk, dropping changes that were never synced."""
+    from postured.settings import Settings, MonitorCalibration
 
     settings = Settings()
-    settings.camera_index = -5
+    settings.sensitivity = 0.5
     settings.sync()
-    settings2 = Settings()
-    assert settings2.camera_index == 0
-
 
-def test_posture_y_clamps_low(mock_qsettings):
-    """Posture Y values are clamped to minimum 0.0."""
-    from postured.settings import Settings
+    settings.sensitivity = 0.3
+    settings.set_monitor_calibration(MonitorCalibration("RELOAD_1920x1080", 0.3, 0.6))
+    settings.reload()
 
-    settings = Settings()
-    settings.good_posture_y = -0.5
-    settings.bad_posture_y = -0.3
-    settings.sync()
-    settings2 = Settings()
-    assert settings2.good_posture_y == 0.0
-    assert settings2.bad_posture_y == 0.0
+    assert settings.sensitivity == 0.5
+    assert settings.get_monitor_calibration("RELOAD_1920x1080") is None
 
 
-def test_posture_y_clamps_high(mock_qsettings):
-    """Posture Y values are clamped to maximum 1.0."""
+def test_reload_clamps_raw_values(mock_qsettings):
+    """reload() clamps out-of-range values written to the config behind its back."""
     from postured.settings import Settings
 
     settings = Settings()
-    settings.good_posture_y = 1.5
-    settings.bad_posture_y = 2.0
-    settings.sync()
-    settings2 = Settings()
-    assert settings2.good_posture_y == 1.0
-    assert settings2.bad_posture_y == 1.0
+    assert settings.get_monitor_calibration("RELOAD_1920x1080") is None
+
+    # Store raw values, bypassing the setters (simulating a hand-edited config)
+    settings._settings.setValue("sensitivity", 2.0)
+    settings._settings.beginGroup("monitors/RELOAD_1920x1080")
+    settings._settings.setValue("good_posture_y", -0.5)
+    settings._settings.setValue("bad_posture_y", 1.5)
+    settings._settings.setValue("is_calibrated", True)
+    settings._settings.endGroup()
+    settings.reload()
+
+    assert settings.sensitivity == 1.0
+    result = settings.get_monitor_calibration("RELOAD_1920x1080")
+    assert result.good_posture_y == 0.0
+    assert result.bad_posture_y == 1.0
 
 
 def test_values_persist_after_set_get_cycle(mock_qsettings):
@@ -285,6 +313,20 @@ class TestMonitorCalibration:
         assert calibration.good_posture_y == 0.38
         assert calibration.bad_posture_y == 0.62
 
+    def test_migrated_calibration_persisted_on_sync(self, mock_qsettings):
+        """Migration leaves the write to the caller's sync()."""
+        from postured.settings import Settings
+
+        settings = Settings()
+        settings.is_calibrated = True
+        settings.sync()
+
+        assert settings.migrate_legacy_calibration("MIGRATE-SYNC_1920x1080")
+        assert Settings().get_monitor_calibration("MIGRATE-SYNC_1920x1080") is None
+
+        settings.sync()
+        assert Settings().get_monitor_calibration("MIGRATE-SYNC_1920x1080")
+
     def test_migrate_legacy_calibration_skips_if_already_exists(self, mock_qsettings):
         """Migration skips if monitor already has calibration."""
         from postured.settings import Settings, MonitorCalibration
@@ -330,18 +372,33 @@ class TestMonitorCalibration:
         """Monitor calibration values are clamped to 0.0-1.0."""
         from postured.settings import Settings, MonitorCalibration
 
-        settings = Settings()
+        qsettings = Settings()._settings
         # Store out-of-range values directly (simulating corrupt config)
-        calibration = MonitorCalibration("TEST_1920x1080", -0.5, 1.5, True)
-        settings.set_monitor_calibration(calibration)
-        settings.sync()
+        qsettings.beginGroup("monitors/TEST_1920x1080")
+        qsettings.setValue("good_posture_y", -0.5)
+        qsettings.setValue("bad_posture_y", 1.5)
+        qsettings.setValue("is_calibrated", True)
+        qsettings.endGroup()
 
-        settings2 = Settings()
-        result = settings2.get_monitor_calibration("TEST_1920x1080")
+        result = Settings().get_monitor_calibration("TEST_1920x1080")
 
         assert result.good_posture_y == 0.0  # Clamped from -0.5
         assert result.bad_posture_y == 1.0  # Clamped from 1.5
 
+    def test_posture_values_clamped_on_write(self, mock_qsettings):
+        """Out-of-range calibration values are clamped before they are stored."""
+        from postured.settings import Settings, MonitorCalibration
+
+        settings = Settings()
+        calibration = MonitorCalibration("TEST_1920x1080", -0.5, 1.5, True)
+        settings.set_monitor_calibration(calibration)
+        settings.sync()
+
+        settings._settings.beginGroup("monitors/TEST_1920x1080")
+        assert float(settings._settings.value("good_posture_y")) == 0.0
+        assert float(settings._settings.value("bad_posture_y")) == 1.0
+        settings._settings.endGroup()
+
     def test_update_existing_calibration(self, mock_qsettings):
         """Can update an existing monitor calibration."""
         from postured.settings import Settings, MonitorCalibration
@@ -363,3 +420,22 @@ class TestMonitorCalibration:
 
         assert result.good_posture_y == 0.30
         assert result.bad_posture_y == 0.70
+
+    def test_calibrations_read_once_and_persisted_on_sync(self, mock_qsettings):
+        """Calibrations are served from memory and written out by sync()."""
+        from postured.settings import Settings, MonitorCalibration
+
+        unique_id = "MEMORY-TEST_2560x1440"
+        settings = Settings()
+        settings.set_monitor_calibration(MonitorCalibration(unique_id, 0.3, 0.6))
+
+        # Visible to this instance straight away, but not yet on disk
+        assert settings.get_monitor_calibration(unique_id) is not None
+        assert unique_id in {
+            c.monitor_id for c in settings.get_all_monitor_calibrations()
+        }
+        assert Settings().get_monitor_calibration(unique_id) is None
+
+        settings.sync()
+        result = Settings().get_monitor_calibration(unique_id)
+        assert result == MonitorCalibration(unique_id, 0.3, 0.6)